@@ -0,0 +1,29 @@
+def choose(seq, sample_size=None):
+    """
+    Samples seq and decides which algorithm should sort it, see
+    `auto_sort.choose`. `auto_sort` is imported on the first call, so that
+    importing a single sorting module does not pull in NumPy.
+
+    :param seq: A list of comparable elements
+    :param sample_size: An integer number of positions to sample
+    :rtype: An `auto_sort.Decision` naming a key of `auto_sort.ALGORITHMS`
+    """
+    from algorithms.sorting import auto_sort
+    if sample_size is None:
+        return auto_sort.choose(seq)
+    return auto_sort.choose(seq, sample_size)
+
+
+def sort(seq, key=None, reverse=False):
+    """
+    Takes a list and sorts it in place with the algorithm picked by
+    `auto_sort.choose`. This sorted list is then returned.
+
+    :param seq: A list of comparable elements
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of sorted elements
+    """
+    from algorithms.sorting import auto_sort
+    return auto_sort.sort(seq, key, reverse)
@@ -0,0 +1,140 @@
+"""
+    Automatic Sort
+    --------------
+    Picks a sorting algorithm by looking at a small random sample of the
+    input, then runs it.
+
+    `choose` samples the list for its size, how much of it already runs in
+    order, how many of its values repeat and whether it holds integers, and
+    returns a `Decision` that names the algorithm together with those
+    measurements so that the choice can be logged. `dispatch` runs a
+    decision and `sort` does both.
+
+    The rules, in order:
+
+    - tiny lists use insertion sort
+    - lists holding NaN, which compares false with everything, use natural
+      merge sort; NumPy and `array.array` buffers of floats holding NaN use
+      radix sort
+    - lists whose sampled neighbours are nearly all in order (either way)
+      use the adaptive natural merge sort
+    - lists of integers use LSD radix sort
+    - lists with many repeated values use three-way quick sort
+    - everything else uses introsort
+
+    Time Complexity: that of the chosen algorithm, plus O(n) to confirm that
+                     every element is an integer, or that none is NaN
+
+    Space Complexity: that of the chosen algorithm
+
+    Stable: No
+
+"""
+from collections import namedtuple
+import random
+
+from algorithms.sorting import (
+    insertion_sort, natural_merge_sort, numpy_backend, quick_sort_in_place,
+    radix_sort, utils)
+from algorithms.sorting.numpy_backend import np
+
+TINY_SIZE = 16
+RADIX_MIN_SIZE = 1000
+SAMPLE_SIZE = 256
+PRESORTED_RATIO = 0.9
+DUPLICATE_RATIO = 0.5
+
+ALGORITHMS = {
+    'insertion_sort': insertion_sort.sort,
+    'natural_merge_sort': natural_merge_sort.sort,
+    'radix_sort': radix_sort.sort,
+    'three_way_quick_sort':
+        lambda seq: quick_sort_in_place.sort(seq, 0, len(seq) - 1),
+    'introsort': quick_sort_in_place.introsort,
+}
+
+Decision = namedtuple('Decision', [
+    'algorithm', 'size', 'ascending_ratio', 'duplicate_ratio', 'integers'])
+
+
+def _is_integer(x):
+    # Radix sort is only picked for plain ints; bools and IntEnum members
+    # are sorted by comparison so that they keep their type.
+    return type(x) is int
+
+
+def _has_nan(seq, buf):
+    if buf is not None:
+        return buf.dtype.kind == 'f' and bool(np.isnan(buf).any())
+    return any(x != x for x in seq)
+
+
+def choose(seq, sample_size=SAMPLE_SIZE):
+    """
+    Samples seq and decides which algorithm should sort it.
+
+    :param seq: A list of comparable elements
+    :param sample_size: An integer number of positions to sample
+    :rtype: A `Decision` naming a key of `ALGORITHMS`
+    """
+    n = len(seq)
+    if n <= TINY_SIZE:
+        return Decision('insertion_sort', n, None, None, None)
+
+    # Sampled neighbour pairs estimate how presorted the list is.
+    positions = sorted(random.sample(range(n - 1), min(sample_size, n - 1)))
+    ascending = sum(1 for i in positions if not seq[i + 1] < seq[i])
+    ascending_ratio = ascending / float(len(positions))
+
+    sample = [seq[i] for i in positions]
+    try:
+        duplicate_ratio = 1 - len(set(sample)) / float(len(sample))
+    except TypeError:
+        duplicate_ratio = 0.0
+    # The sample only suggests integers; radix sort needs all of them.
+    integers = (all(_is_integer(x) for x in sample) and
+                all(_is_integer(x) for x in seq))
+    # The partitioning sorts need a total order, which NaN breaks.
+    buf = numpy_backend.as_buffer(seq)
+    nans = not integers and _has_nan(seq, buf)
+
+    if nans:
+        algorithm = 'natural_merge_sort' if buf is None else 'radix_sort'
+    elif (ascending_ratio >= PRESORTED_RATIO or
+            ascending_ratio <= 1 - PRESORTED_RATIO):
+        algorithm = 'natural_merge_sort'
+    elif integers and n >= RADIX_MIN_SIZE:
+        algorithm = 'radix_sort'
+    elif duplicate_ratio >= DUPLICATE_RATIO:
+        algorithm = 'three_way_quick_sort'
+    else:
+        algorithm = 'introsort'
+    return Decision(algorithm, n, ascending_ratio, duplicate_ratio, integers)
+
+
+def dispatch(seq, decision):
+    """
+    Sorts seq in place with the algorithm named by a decision.
+
+    :param seq: A list of comparable elements
+    :param decision: A `Decision` returned by `choose`
+    :rtype: A list of sorted elements
+    """
+    return ALGORITHMS[decision.algorithm](seq)
+
+
+def sort(seq, key=None, reverse=False):
+    """
+    Takes a list and sorts it in place with the algorithm picked by
+    `choose`. This sorted list is then returned.
+
+    :param seq: A list of comparable elements
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of sorted elements
+    """
+    if key is not None or reverse:
+        utils.assign(seq, utils.keyed_sort(sort, seq, key, reverse))
+        return seq
+    return dispatch(seq, choose(seq))
@@ -16,16 +16,23 @@
 
 import random
 
+from algorithms.sorting import utils
 
-def sort(seq):
+
+def sort(seq, key=None, reverse=False):
     """
     Takes a list of integers and sorts them in ascending order. This sorted
     list is then returned.
 
     :param seq: A list of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
     :rtype: A list of sorted integers
     """
-
+    if key is not None or reverse:
+        seq[:] = utils.keyed_sort(sort, seq, key, reverse)
+        return seq
     if len(seq) == 1:
         return seq
     random.seed()
@@ -40,6 +47,19 @@ def sort(seq):
     return seq
 
 
+def argsort(seq, key=None, reverse=False):
+    """
+    Returns the permutation of indices that sorts seq. seq is not modified.
+
+    :param seq: A list of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of indices
+    """
+    return utils.argsort(sort, seq, key, reverse)
+
+
 def is_sorted(seq):
     """
     Takes a list of integers and checks if the list is in sorted order.
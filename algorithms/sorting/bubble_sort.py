@@ -12,19 +12,39 @@
     Psuedo code: http://en.wikipedia.org/wiki/Bubble_sort
 
 """
+from algorithms.sorting import utils
 
 
-def sort(seq):
+def sort(seq, key=None, reverse=False):
     """
     Takes a list of integers and sorts them in ascending order. This sorted
     list is then returned.
 
     :param seq: A list of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
     :rtype: A list of sorted integers
     """
+    if key is not None or reverse:
+        seq[:] = utils.keyed_sort(sort, seq, key, reverse)
+        return seq
     L = len(seq)
     for _ in range(L):
         for n in range(1, L):
             if seq[n] < seq[n - 1]:
                 seq[n - 1], seq[n] = seq[n], seq[n - 1]
     return seq
+
+
+def argsort(seq, key=None, reverse=False):
+    """
+    Returns the permutation of indices that sorts seq. seq is not modified.
+
+    :param seq: A list of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of indices
+    """
+    return utils.argsort(sort, seq, key, reverse)
@@ -0,0 +1,201 @@
+"""
+    Bucket Sort
+    -----------
+    A distribution sort for numbers, such as scores in [0, 1). The range of
+    the keys is split in to about n / BUCKET_SIZE buckets, every element is
+    appended to its bucket in O(1), and the buckets, which are small, are
+    sorted one by one with insertion sort and concatenated.
+
+    Equal-width buckets only stay small for uniform data, so the bucket
+    boundaries follow a histogram of a random sample of the keys instead:
+    the sampled distribution function is linear within each histogram bin,
+    and each bin gets a share of the buckets equal to its share of the
+    sample. A key is still mapped to its bucket with one multiplication and
+    a table lookup. A bucket that ends up big anyway, for example because
+    many keys are equal, is sorted with natural merge sort, which is stable
+    like insertion sort, so the worst case stays O(n log n). Keys that are
+    not finite, such as inf or NaN, have no range to split, and the whole
+    input is then merge sorted (radix sorted for NumPy buffers) instead.
+
+    NumPy arrays and numeric `array.array` objects are sorted in place by
+    `numpy_backend.bucket_sort`; their buckets are found with the same
+    tables, in one vectorized step for the whole array.
+
+    Time Complexity: O(n) expected for keys with a bounded density,
+                     O(n log n) worst case
+
+    Space Complexity: O(n) Auxiliary
+
+    Stable: Yes
+
+    Psuedo Code: CLRS. Introduction to Algorithms. 3rd ed. 8.4 Bucket sort.
+
+"""
+import random
+
+from algorithms.sorting import (insertion_sort, natural_merge_sort,
+                                numpy_backend, utils)
+from algorithms.sorting.numpy_backend import np
+
+BUCKET_SIZE = 4
+SAMPLE_SIZE = 1024
+SAMPLES_PER_BIN = 8
+INSERTION_SORT_THRESHOLD = 32
+
+
+def histogram(sample, lo, hi, bins):
+    """
+    Returns the cumulative distribution of sample over bins equal-width
+    bins between lo and hi. Every bin starts with a count of one, so that
+    ranges the sample missed still get some buckets.
+
+    :param sample: A list of numbers between lo and hi
+    :param lo: The smallest number of the range
+    :param hi: The largest number of the range, bigger than lo
+    :param bins: An integer number of bins
+    :rtype: A list of bins + 1 increasing fractions from 0.0 to 1.0, the
+            share of the sample below each bin boundary
+    """
+    counts = [1] * bins
+    scale = bins / float(hi - lo)
+    last = bins - 1
+    for x in sample:
+        j = int((x - lo) * scale)
+        counts[j if j < last else last] += 1
+    total = float(len(sample) + bins)
+    cdf = [0.0]
+    seen = 0
+    for count in counts:
+        seen += count
+        cdf.append(seen / total)
+    return cdf
+
+
+def _bins(sample, lo, hi):
+    # Returns the number of histogram bins for the sample and the factor
+    # that maps a key to its bin, or None for a range that float
+    # arithmetic cannot scale: inf, NaN or ints too far apart.
+    bins = max(1, len(sample) // SAMPLES_PER_BIN)
+    try:
+        scale = bins / float(hi - lo)
+    except (OverflowError, ZeroDivisionError):
+        return bins, None
+    if not 0 < scale < float('inf'):
+        return bins, None
+    return bins, scale
+
+
+def _tables(cdf, buckets):
+    # Bin j owns buckets first[j] to top[j] and spreads its keys linearly
+    # over width[j] of them.
+    bins = len(cdf) - 1
+    first = [int(buckets * f) for f in cdf]
+    width = [first[j + 1] - first[j] for j in range(bins)]
+    top = [max(first[j], first[j + 1] - 1) for j in range(bins)]
+    return first[:-1], width, top
+
+
+def _sort_buckets(items, keys, sample_size):
+    if any(k != k for k in keys):
+        # min and max are meaningless once a NaN is among the keys.
+        return natural_merge_sort.sort(items)
+    n = len(items)
+    lo = min(keys)
+    hi = max(keys)
+    if not lo < hi:
+        # Every key is equal; they all go to one bucket.
+        hi = lo + 1
+    sample = random.sample(keys, sample_size) if n > sample_size else keys
+    bins, scale = _bins(sample, lo, hi)
+    if scale is None:
+        return natural_merge_sort.sort(items)
+    cdf = histogram(sample, lo, hi, bins)
+    buckets = max(1, n // BUCKET_SIZE)
+    first, width, top = _tables(cdf, buckets)
+    last = bins - 1
+
+    table = [[] for _ in range(buckets)]
+    for x, k in zip(items, keys):
+        t = (k - lo) * scale
+        j = int(t)
+        if j > last:
+            j = last
+        b = first[j] + int((t - j) * width[j])
+        if b > top[j]:
+            b = top[j]
+        table[b].append(x)
+
+    result = []
+    for bucket in table:
+        if len(bucket) > INSERTION_SORT_THRESHOLD:
+            natural_merge_sort.sort(bucket)
+        elif len(bucket) > 1:
+            insertion_sort.sort(bucket)
+        result += bucket
+    return result
+
+
+def sort(seq, key=None, reverse=False, use_numpy=None,
+         sample_size=SAMPLE_SIZE):
+    """
+    Takes a list of numbers and sorts them in ascending order. This sorted
+    list is then returned.
+
+    :param seq: A list of integers or floats
+    :param key: A function of one argument that returns a numeric sort key
+                for an element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :param use_numpy: A boolean, False to sort NumPy arrays and
+                      `array.array` objects in pure Python. Defaults to
+                      using NumPy when it is installed
+    :param sample_size: An integer number of keys sampled for the histogram
+    :rtype: A list of sorted numbers
+    """
+    buf = None
+    if key is None and use_numpy is not False:
+        buf = numpy_backend.as_buffer(seq)
+    if buf is not None:
+        if len(buf) > 1:
+            lo = buf.min().item()
+            hi = buf.max().item()
+            size = min(len(buf), sample_size)
+            sample = buf[np.random.randint(0, len(buf), size)].tolist()
+            bins, scale = _bins(sample, lo, hi)
+            if scale is not None:
+                cdf = histogram(sample, lo, hi, bins)
+                first, width, top = [np.array(t) for t in _tables(
+                    cdf, max(1, len(buf) // BUCKET_SIZE))]
+                t = (buf.astype(np.float64) - lo) * scale
+                j = np.minimum(t.astype(np.intp), bins - 1)
+                ids = first[j] + ((t - j) * width[j]).astype(np.intp)
+                numpy_backend.bucket_sort(buf, np.minimum(ids, top[j]),
+                                          reverse)
+            elif not lo == hi:
+                numpy_backend.radix_sort(buf, reverse)
+        return seq
+
+    if len(seq) < 2:
+        return seq
+    if key is not None or reverse:
+        decorated = utils.decorate(seq, key, reverse)
+        keys = [k for k, _, _ in decorated]
+        utils.assign(seq, utils.undecorate(
+            _sort_buckets(decorated, keys, sample_size), reverse))
+        return seq
+    utils.assign(seq, _sort_buckets(list(seq), list(seq), sample_size))
+    return seq
+
+
+def argsort(seq, key=None, reverse=False):
+    """
+    Returns the permutation of indices that sorts seq. seq is not modified.
+
+    :param seq: A list of numbers
+    :param key: A function of one argument that returns a numeric sort key
+                for an element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of indices
+    """
+    keys = list(seq) if key is None else [key(x) for x in seq]
+    return sort(list(range(len(keys))), key=keys.__getitem__,
+                reverse=reverse)
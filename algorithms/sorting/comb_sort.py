@@ -12,17 +12,23 @@
     Psuedo code: http://en.wikipedia.org/wiki/Comb_sort
 
 """
+from algorithms.sorting import utils
 
 
-def sort(seq):
+def sort(seq, key=None, reverse=False):
     """
     Takes a list of integers and sorts them in ascending order. This sorted
     list is then returned.
 
     :param seq: A list of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
     :rtype: A list of sorted integers
     """
-
+    if key is not None or reverse:
+        seq[:] = utils.keyed_sort(sort, seq, key, reverse)
+        return seq
     gap = len(seq)
     swap = True
 
@@ -34,3 +40,16 @@ def sort(seq):
                 seq[i], seq[i + gap] = seq[i + gap], seq[i]
                 swap = True
     return seq
+
+
+def argsort(seq, key=None, reverse=False):
+    """
+    Returns the permutation of indices that sorts seq. seq is not modified.
+
+    :param seq: A list of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of indices
+    """
+    return utils.argsort(sort, seq, key, reverse)
@@ -0,0 +1,127 @@
+"""
+    Cycle Sort
+    ----------
+    A sort that writes to the sequence as few times as possible, for data
+    where writes are expensive: flash, memory-mapped files or proxies that
+    count every store.
+
+    Any permutation splits in to cycles, and a cycle of length L can be
+    rotated in to place with exactly L writes by carrying one element in
+    hand. Elements that are already in their final position are never
+    written. With repeated keys the final position of an element is not
+    unique, so every element whose key belongs in the block it already
+    occupies is left where it is, and only the others are assigned the
+    remaining slots of their block. The total number of writes is then the
+    number of elements that must move, which is the minimum for any sort.
+
+    Unlike the textbook cycle sort, which rescans the sequence to find each
+    destination, the destinations are found by sorting the keys on the side
+    with `natural_merge_sort`, so only reads and writes to the sequence
+    itself are O(n).
+
+    Time Complexity: O(n log n), with at most n writes and 2n reads
+
+    Space Complexity: O(n) Auxiliary
+
+    Stable: No
+
+    Psuedo Code: https://en.wikipedia.org/wiki/Cycle_sort
+
+"""
+from algorithms.sorting import natural_merge_sort, utils
+
+
+def destinations(keys, reverse=False):
+    """
+    Returns the final position of every element, leaving as many elements
+    as possible where they are.
+
+    :param keys: A list of sort keys
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list where element i must move to position dest[i]
+    """
+    n = len(keys)
+    order = utils.argsort(natural_merge_sort.sort, keys, reverse=reverse)
+    dest = list(range(n))
+    lo = 0
+    while lo < n:
+        # order[lo:hi] are the elements with keys equal to keys[order[lo]].
+        hi = lo + 1
+        first = keys[order[lo]]
+        while hi < n and not (keys[order[hi]] < first or
+                              first < keys[order[hi]]):
+            hi += 1
+        # Elements already inside [lo, hi) stay and the others are given
+        # the slots that are left, in order.
+        movers = [i for i in order[lo:hi] if not lo <= i < hi]
+        if movers:
+            staying = set(i for i in order[lo:hi] if lo <= i < hi)
+            free = (p for p in range(lo, hi) if p not in staying)
+            for i, p in zip(movers, free):
+                dest[i] = p
+        lo = hi
+    return dest
+
+
+def sort_counting_writes(seq, key=None, reverse=False):
+    """
+    Sorts seq in place with the minimum number of writes and returns that
+    number. Only len(), integer indexing and item assignment are used, so
+    seq can be any `MutableSequence`, including views over an mmap.
+
+    :param seq: A mutable sequence of comparable elements
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: The integer number of writes to seq
+    """
+    n = len(seq)
+    keys = [seq[i] for i in range(n)]
+    if key is not None:
+        keys = [key(x) for x in keys]
+    dest = destinations(keys, reverse)
+
+    writes = 0
+    for start in range(n):
+        j = dest[start]
+        if j == start:
+            continue
+        # Carry the element along its cycle; every position of the cycle
+        # is written once and then marked as settled.
+        item = seq[start]
+        while j != start:
+            item, seq[j] = seq[j], item
+            writes += 1
+            dest[j], j = j, dest[j]
+        seq[start] = item
+        writes += 1
+        dest[start] = start
+    return writes
+
+
+def sort(seq, key=None, reverse=False):
+    """
+    Takes a mutable sequence and sorts it in place with the minimum number
+    of writes. This sorted sequence is then returned.
+
+    :param seq: A mutable sequence of comparable elements
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A sorted sequence
+    """
+    sort_counting_writes(seq, key, reverse)
+    return seq
+
+
+def argsort(seq, key=None, reverse=False):
+    """
+    Returns the permutation of indices that sorts seq. seq is not modified.
+
+    :param seq: A list of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of indices
+    """
+    return utils.argsort(sort, seq, key, reverse)
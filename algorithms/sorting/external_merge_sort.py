@@ -0,0 +1,171 @@
+"""
+    External Merge Sort
+    -------------------
+    Sorts data sets that do not fit in memory. The input is consumed in
+    chunks of at most `buffer_size` items; each chunk is sorted in memory and
+    written to a temporary file as a sorted run. The runs are then merged
+    by `kway_merge` and streamed back to the caller.
+
+    At most `fan_in` runs are merged at a time, so the number of open files
+    stays bounded however big the input is. Runs are kept in levels: once
+    a level holds `fan_in` runs they are merged in to one run on the next
+    level and closed. The levels left at the end are merged, again
+    `fan_in` runs at a time, until one pass can stream the result.
+
+    Time Complexity: O(n log n)
+
+    Space Complexity: O(buffer_size) memory, O(n) disk
+
+    Stable: Yes
+
+    Psuedo Code: https://en.wikipedia.org/wiki/External_sorting
+
+"""
+import pickle
+import tempfile
+
+from algorithms.sorting import kway_merge, merge_sort, utils
+
+FAN_IN = 16
+
+
+def write_run(items):
+    """
+    Sorts a chunk of items in memory and writes it to a temporary file as a
+    sorted run. The file is rewound and returned.
+
+    :param items: A list of comparable items
+    :rtype: A file object positioned at the start of the run
+    """
+    run = tempfile.TemporaryFile()
+    dump = pickle.dump
+    for item in merge_sort.sort(items):
+        dump(item, run, pickle.HIGHEST_PROTOCOL)
+    run.seek(0)
+    return run
+
+
+def read_run(run):
+    """
+    Yields the items of a sorted run written by `write_run`.
+
+    :param run: A file object returned by `write_run`
+    :rtype: A generator of items
+    """
+    load = pickle.load
+    while True:
+        try:
+            yield load(run)
+        except EOFError:
+            return
+
+
+def merge_runs(runs):
+    """
+    k-way merges sorted iterators with `kway_merge.merge`. Ties are broken
+    by the index of the run so that items from earlier runs are yielded
+    first.
+
+    :param runs: A list of iterators over sorted items
+    :rtype: A generator of sorted items
+    """
+    return kway_merge.merge(runs)
+
+
+def merge_to_run(runs):
+    """
+    Merges sorted runs written by `write_run` in to one new run and closes
+    them. The new run is rewound and returned.
+
+    :param runs: A list of file objects returned by `write_run`, in input
+                 order
+    :rtype: A file object positioned at the start of the merged run
+    """
+    run = tempfile.TemporaryFile()
+    try:
+        dump = pickle.dump
+        for item in merge_runs([read_run(r) for r in runs]):
+            dump(item, run, pickle.HIGHEST_PROTOCOL)
+    except BaseException:
+        run.close()
+        raise
+    finally:
+        for r in runs:
+            r.close()
+    run.seek(0)
+    return run
+
+
+def _add_run(levels, run, fan_in):
+    # Every run of a level is older than the runs of the levels below it,
+    # so merging a full level keeps equal items in input order.
+    for level in levels:
+        level.append(run)
+        if len(level) < fan_in:
+            return
+        run = merge_to_run(level)
+        del level[:]
+    levels.append([run])
+
+
+def sort(iterable, buffer_size=100000, key=None, reverse=False,
+         fan_in=FAN_IN):
+    """
+    Takes any iterable of comparable items and yields them in ascending
+    order. At most `buffer_size` items are held in memory while the sorted
+    runs are being built, and at most `fan_in` runs are merged at a time.
+
+    :param iterable: An iterable of comparable items
+    :param buffer_size: The maximum number of items per in-memory run
+    :param key: A function of one argument that returns the sort key of an
+                item, it is called exactly once per item
+    :param reverse: A boolean, True to sort in descending order
+    :param fan_in: The maximum number of runs merged at a time, at least 2
+    :rtype: A generator of sorted items
+    """
+    if buffer_size < 1:
+        raise ValueError("buffer_size must be at least 1")
+    if fan_in < 2:
+        raise ValueError("fan_in must be at least 2")
+
+    if key is not None or reverse:
+        # The output is streamed, so a reverse sort cannot be reversed at
+        # the end; the keys are wrapped to compare backwards instead.
+        decorated = ((x if key is None else key(x), i, x)
+                     for i, x in enumerate(iterable))
+        if reverse:
+            decorated = ((utils.ReverseKey(k), i, x)
+                         for k, i, x in decorated)
+        for _, _, x in sort(decorated, buffer_size, fan_in=fan_in):
+            yield x
+        return
+
+    levels = []
+    runs = []
+    try:
+        chunk = []
+        for item in iterable:
+            chunk.append(item)
+            if len(chunk) == buffer_size:
+                _add_run(levels, write_run(chunk), fan_in)
+                chunk = []
+
+        # Input that fits in one buffer never touches the disk.
+        if not levels:
+            for item in merge_sort.sort(chunk):
+                yield item
+            return
+        if chunk:
+            _add_run(levels, write_run(chunk), fan_in)
+        chunk = None
+
+        runs = [run for level in reversed(levels) for run in level]
+        levels = []
+        while len(runs) > fan_in:
+            runs = [merge_to_run(runs[i:i + fan_in])
+                    for i in range(0, len(runs), fan_in)]
+        for item in merge_runs([read_run(run) for run in runs]):
+            yield item
+    finally:
+        for run in runs + [run for level in levels for run in level]:
+            run.close()
@@ -3,66 +3,182 @@
     ---------
     Uses the max heap data structure implemented in a list.
 
+    The heap is d-ary: node i has the children d*i + 1 ... d*i + d. `sort`
+    uses d = `ARITY` = 4 by default; the heap functions it is built from
+    default to the classic binary heap. A wider heap is shallower, so every
+    sift does fewer levels, and the children of a node sit next to each
+    other in memory.
+    Sifting is iterative and moves a single "hole" down the heap instead of
+    swapping at every level. Only indexing is used, so the heap works on
+    lists, `array.array` and NumPy arrays alike.
+
     Time Complexity: O(n log n)
 
     Space Complexity: O(1) Auxiliary
 
-    Stable: Yes
+    Stable: No
 
     Psuedo Code: CLRS. Introduction to Algorithms. 3rd ed.
 
+    NumPy arrays and numeric `array.array` objects are sorted in place by
+    `numpy_backend.heap_sort` when NumPy is installed.
+
 """
+from algorithms.sorting import numpy_backend, utils
+
+ARITY = 4
+
+
+def sift_down(seq, i, n, arity=2, lo=0):
+    """
+    Lets the value at the root of the subtree i "float down" until the
+    subtree is a max-heap again. The heap occupies seq[lo:lo + n], and i is
+    relative to lo.
+
+    :param seq: A list of integers
+    :param i: An integer index of the root of the subtree
+    :param n: An integer number of elements in the heap
+    :param arity: An integer number of children per node
+    :param lo: An integer index of the first element of the heap
+    """
+    if i >= n:
+        return
+    end = lo + n
+    pos = lo + i
+    item = seq[pos]
+    while True:
+        child = lo + arity * (pos - lo) + 1
+        if child >= end:
+            break
+        last = min(child + arity, end)
+        largest = seq[child]
+        c = child + 1
+        while c < last:
+            value = seq[c]
+            if value > largest:
+                child, largest = c, value
+            c += 1
+        if not largest > item:
+            break
+        seq[pos] = largest
+        pos = child
+    seq[pos] = item
+
+
+def min_sift_down(seq, i, n, arity=2, lo=0):
+    """
+    The min-heap counterpart of `sift_down`: lets the value at the root of
+    the subtree i float down until the subtree is a min-heap again.
+
+    :param seq: A list of integers
+    :param i: An integer index of the root of the subtree
+    :param n: An integer number of elements in the heap
+    :param arity: An integer number of children per node
+    :param lo: An integer index of the first element of the heap
+    """
+    if i >= n:
+        return
+    end = lo + n
+    pos = lo + i
+    item = seq[pos]
+    while True:
+        child = lo + arity * (pos - lo) + 1
+        if child >= end:
+            break
+        last = min(child + arity, end)
+        smallest = seq[child]
+        c = child + 1
+        while c < last:
+            value = seq[c]
+            if value < smallest:
+                child, smallest = c, value
+            c += 1
+        if not smallest < item:
+            break
+        seq[pos] = smallest
+        pos = child
+    seq[pos] = item
 
 
 def max_heapify(seq, i, n):
     """
     The function of max_heapify is to let the value at seq[i] "float down" in
-    the max-heap so that the subtree rooted at index i becomes a max-heap.
+    the binary max-heap so that the subtree rooted at index i becomes a
+    max-heap.
 
     :param seq: A list of integers
     :param i: An integer that is an index in to the list that represents the
               root of a subtree that max heapify is called on.
-    :param n: length of the list
+    :param n: An integer index of the last element of the heap
     """
-    l = 2 * i + 1
-    r = 2 * i + 2
+    sift_down(seq, i, n + 1)
+
 
-    if l <= n and seq[l] > seq[i]:
-        largest = l
-    else:
-        largest = i
-    if r <= n and seq[r] > seq[largest]:
-        largest = r
+def build_heap(seq, n=None, arity=2, lo=0, sift=sift_down):
+    """
+    Turns seq[lo:lo + n] in to a max-heap by sifting down every internal
+    node, starting from the last one.
 
-    if largest != i:
-        seq[i], seq[largest] = seq[largest], seq[i]
-        max_heapify(seq, largest, n)
+    :param seq: A list of integers
+    :param n: An integer number of elements, defaults to the whole list
+    :param arity: An integer number of children per node
+    :param lo: An integer index of the first element of the heap
+    :param sift: The sift function, `min_sift_down` builds a min-heap
+    """
+    if n is None:
+        n = len(seq) - lo
+    for i in range((n - 2) // arity, -1, -1):
+        sift(seq, i, n, arity, lo)
 
 
-def build_heap(seq):
+def sort_range(seq, lo, hi, arity=2):
     """
-    Continously calls max_heapify on the list for each subtree.
+    Sorts seq[lo:hi] in place in ascending order.
 
     :param seq: A list of integers
+    :param lo: An integer representing the beginning index
+    :param hi: An integer representing the end index, exclusive
+    :param arity: An integer number of children per node
     """
-    n = len(seq) - 1
-    for i in range(n//2, -1, -1):
-        max_heapify(seq, i, n)
+    n = hi - lo
+    build_heap(seq, n, arity, lo)
+    for end in range(n - 1, 0, -1):
+        seq[lo], seq[lo + end] = seq[lo + end], seq[lo]
+        sift_down(seq, 0, end, arity, lo)
 
 
-def sort(seq):
+def sort(seq, key=None, reverse=False, arity=ARITY):
     """
     Takes a list of integers and sorts them in ascending order. This sorted
     list is then returned.
 
     :param seq: A list of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :param arity: An integer number of children per node of the heap
     :rtype: A list of sorted integers
     """
-    build_heap(seq)
-    heap_size = len(seq) - 1
-    for x in range(heap_size, 0, -1):
-        seq[0], seq[x] = seq[x], seq[0]
-        heap_size = heap_size - 1
-        max_heapify(seq, 0, heap_size)
-
+    buf = numpy_backend.as_buffer(seq) if key is None else None
+    if buf is not None:
+        numpy_backend.heap_sort(buf, reverse)
+        return seq
+    if key is not None or reverse:
+        utils.assign(seq, utils.keyed_sort(lambda s: sort(s, arity=arity),
+                                           seq, key, reverse))
+        return seq
+    sort_range(seq, 0, len(seq), arity)
     return seq
+
+
+def argsort(seq, key=None, reverse=False):
+    """
+    Returns the permutation of indices that sorts seq. seq is not modified.
+
+    :param seq: A list of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of indices
+    """
+    return utils.argsort(sort, seq, key, reverse)
@@ -0,0 +1,183 @@
+"""
+    In-Place Merge Sort
+    -------------------
+    A stable merge sort that merges without a buffer. Small blocks are
+    insertion sorted, then runs of doubling width are merged bottom up with
+    SymMerge: the longest prefix of the right run that belongs before a
+    suffix of the left run is found by one binary search around the middle
+    of the two runs, the two pieces are rotated past each other, and each
+    half is merged again the same way.
+
+    A rotation swaps blocks of the list, or holds the shorter side aside
+    once it is at most SWAP_CHUNK elements long, and always copies at most
+    SWAP_CHUNK elements at a time. Apart from the O(log n) recursion no
+    memory proportional to the list is ever allocated. Runs that are
+    already in order are not merged.
+
+    Time Complexity: O(n log**2 n), O(n) on sorted input
+
+    Space Complexity: O(log n) Auxiliary
+
+    Stable: Yes
+
+    Psuedo Code: Kim, P. and Kutzner, A. Stable Minimum Storage Merging by
+                 Symmetric Comparisons. ESA 2004.
+
+"""
+from bisect import bisect_left, bisect_right
+
+from algorithms.sorting import utils
+
+INSERTION_SORT_THRESHOLD = 20
+SWAP_CHUNK = 256
+
+
+def swap_blocks(seq, a, b, n):
+    """
+    Swaps the non-overlapping blocks seq[a:a + n] and seq[b:b + n].
+
+    :param seq: A list
+    :param a: An integer start of the first block
+    :param b: An integer start of the second block
+    :param n: An integer length of both blocks
+    """
+    for k in range(0, n, SWAP_CHUNK):
+        size = min(SWAP_CHUNK, n - k)
+        i, j = a + k, b + k
+        seq[i:i + size], seq[j:j + size] = (seq[j:j + size],
+                                            seq[i:i + size])
+
+
+def _shift(seq, src, dst, n):
+    # Copies seq[src:src + n] to seq[dst:dst + n] in chunks, front to back
+    # when moving left and back to front when moving right, so overlapping
+    # ranges are safe.
+    if dst < src:
+        chunks = range(0, n, SWAP_CHUNK)
+    else:
+        chunks = reversed(range(0, n, SWAP_CHUNK))
+    for k in chunks:
+        size = min(SWAP_CHUNK, n - k)
+        seq[dst + k:dst + k + size] = seq[src + k:src + k + size]
+
+
+def rotate(seq, lo, mid, hi):
+    """
+    Rotates seq[lo:hi] in place so that seq[mid:hi] comes before
+    seq[lo:mid], by swapping blocks of equal length until one side is
+    short enough to hold aside.
+
+    :param seq: A list
+    :param lo: An integer start of the range
+    :param mid: An integer start of the block moved to the front
+    :param hi: An integer end of the range
+    """
+    i = mid - lo
+    j = hi - mid
+    while i != j:
+        if j <= SWAP_CHUNK:
+            right = seq[mid:mid + j]
+            _shift(seq, mid - i, mid - i + j, i)
+            seq[mid - i:mid - i + j] = right
+            return
+        if i <= SWAP_CHUNK:
+            left = seq[mid - i:mid]
+            _shift(seq, mid, mid - i, j)
+            seq[mid + j - i:mid + j] = left
+            return
+        if i > j:
+            swap_blocks(seq, mid - i, mid, j)
+            i -= j
+        else:
+            swap_blocks(seq, mid - i, mid + j - i, i)
+            j -= i
+    swap_blocks(seq, mid - i, mid, i)
+
+
+def sym_merge(seq, lo, mid, hi):
+    """
+    Merges the sorted runs seq[lo:mid] and seq[mid:hi] in place.
+
+    :param seq: A list holding the two sorted runs
+    :param lo: An integer representing the start of the left run
+    :param mid: An integer representing the start of the right run
+    :param hi: An integer representing the end of the right run
+    """
+    if not seq[mid] < seq[mid - 1]:
+        return
+    if mid - lo == 1:
+        rotate(seq, lo, mid, bisect_left(seq, seq[lo], mid, hi))
+        return
+    if hi - mid == 1:
+        rotate(seq, bisect_right(seq, seq[mid], lo, mid), mid, hi)
+        return
+
+    # Find the split where seq[start:mid] and seq[mid:end] trade places:
+    # the pieces are symmetric around the middle of seq[lo:hi].
+    half = (lo + hi) // 2
+    total = half + mid
+    if mid > half:
+        start, stop = total - hi, half
+    else:
+        start, stop = lo, mid
+    last = total - 1
+    while start < stop:
+        c = (start + stop) // 2
+        if not seq[last - c] < seq[c]:
+            start = c + 1
+        else:
+            stop = c
+    end = total - start
+
+    if start < mid < end:
+        rotate(seq, start, mid, end)
+    if lo < start < half:
+        sym_merge(seq, lo, start, half)
+    if half < end < hi:
+        sym_merge(seq, half, end, hi)
+
+
+def sort(seq, key=None, reverse=False):
+    """
+    Takes a list of integers and sorts them in ascending order in place,
+    without an auxiliary buffer. This sorted list is then returned.
+
+    :param seq: A list of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of sorted integers
+    """
+    if key is not None or reverse:
+        seq[:] = utils.keyed_sort(sort, seq, key, reverse)
+        return seq
+    n = len(seq)
+
+    width = INSERTION_SORT_THRESHOLD
+    for lo in range(0, n, width):
+        for i in range(lo + 1, min(lo + width, n)):
+            item = seq[i]
+            hole = i
+            while hole > lo and seq[hole - 1] > item:
+                seq[hole] = seq[hole - 1]
+                hole -= 1
+            seq[hole] = item
+
+    while width < n:
+        for lo in range(0, n - width, 2 * width):
+            sym_merge(seq, lo, lo + width, min(lo + 2 * width, n))
+        width *= 2
+    return seq
+
+
+def argsort(seq, key=None, reverse=False):
+    """
+    Returns the permutation of indices that sorts seq. seq is not modified.
+
+    :param seq: A list of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of indices
+    """
+    return utils.argsort(sort, seq, key, reverse)
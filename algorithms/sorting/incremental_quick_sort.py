@@ -0,0 +1,74 @@
+"""
+    Incremental Quick Sort
+    ----------------------
+    Yields the elements of a list in sorted order on demand. Only the part
+    of the list that holds the next element is partitioned: the range that
+    starts at the next output position is split around a random pivot, the
+    right side is pushed on an explicit stack and the left side is split
+    again until it is small enough to finish with insertion sort. Ranges
+    that were never reached are never sorted, so reading only the first k
+    elements costs far less than a full sort.
+
+    Time Complexity: O(n + k log k) expected for the first k elements
+
+    Space Complexity: O(n) Auxiliary
+
+    Stable: No
+
+    Psuedo Code: Paredes, R. and Navarro, G. Optimal Incremental Sorting.
+                 ALENEX 2006.
+
+"""
+from random import randrange
+
+from algorithms.sorting import utils
+from algorithms.sorting.quick_sort_in_place import (
+    INSERTION_SORT_THRESHOLD, insertion_sort, three_way_partition)
+
+
+def sort(iterable, key=None, reverse=False):
+    """
+    Takes any iterable of integers and yields them in ascending order. The
+    input is copied in to a list up front; the sorting itself is done lazily
+    as elements are requested.
+
+    :param iterable: An iterable of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to yield in descending order
+    :rtype: A generator of sorted integers
+    """
+    if key is not None or reverse:
+        # Elements are yielded as they are found, so a reverse sort cannot
+        # be reversed at the end; the keys compare backwards instead.
+        decorated = [(x if key is None else key(x), i, x)
+                     for i, x in enumerate(iterable)]
+        if reverse:
+            decorated = [(utils.ReverseKey(k), i, x)
+                         for k, i, x in decorated]
+        for _, _, x in sort(decorated):
+            yield x
+        return
+
+    seq = list(iterable)
+    n = len(seq)
+    # Every entry is the end of a range that starts where the entry below
+    # it ends, and a flag telling whether the range is already in place.
+    stack = [(n, False)] if n else []
+    idx = 0
+    while stack:
+        end, done = stack.pop()
+        if not done and end - idx > INSERTION_SORT_THRESHOLD:
+            lt, gt = three_way_partition(seq, idx, end - 1,
+                                         randrange(idx, end))
+            if gt + 1 < end:
+                stack.append((end, False))
+            stack.append((gt + 1, True))
+            if lt > idx:
+                stack.append((lt, False))
+            continue
+        if not done:
+            insertion_sort(seq, idx, end - 1)
+        while idx < end:
+            yield seq[idx]
+            idx += 1
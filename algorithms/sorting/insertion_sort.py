@@ -12,16 +12,23 @@
     Psuedo Code: CLRS. Introduction to Algorithms. 3rd ed.
 
 """
+from algorithms.sorting import utils
 
 
-def sort(seq):
+def sort(seq, key=None, reverse=False):
     """
     Takes a list of integers and sorts them in ascending order. This sorted
     list is then returned.
 
     :param seq: A list of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
     :rtype: A list of integers
     """
+    if key is not None or reverse:
+        seq[:] = utils.keyed_sort(sort, seq, key, reverse)
+        return seq
     for n in range(1, len(seq)):
         item = seq[n]
         hole = n
@@ -30,3 +37,16 @@ def sort(seq):
             hole = hole - 1
         seq[hole] = item
     return seq
+
+
+def argsort(seq, key=None, reverse=False):
+    """
+    Returns the permutation of indices that sorts seq. seq is not modified.
+
+    :param seq: A list of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of indices
+    """
+    return utils.argsort(sort, seq, key, reverse)
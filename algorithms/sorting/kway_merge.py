@@ -0,0 +1,64 @@
+"""
+    K-Way Merge
+    -----------
+    Lazily merges any number of sorted iterables, such as files, generators
+    or sockets, in to one sorted stream. Only the current item of every
+    input is held in memory.
+
+    The current item of every input sits in a binary min-heap as a
+    [key, index, item, iterator] entry. The smallest entry is yielded, then
+    refilled from its own iterator and moved back down in a single
+    `heapq.heapreplace`, so each item costs one O(log k) sift done in C.
+    The index breaks ties between equal keys, so items are never compared
+    directly and equal items are yielded in the order of their inputs.
+
+    Time Complexity: O(n log k) for n items from k inputs
+
+    Space Complexity: O(k) Auxiliary
+
+    Stable: Yes
+
+    Psuedo Code: https://en.wikipedia.org/wiki/K-way_merge_algorithm
+
+"""
+import heapq
+
+
+def merge(iterables, key=None, dedupe=False):
+    """
+    Takes sorted iterables and yields all of their items in sorted order.
+
+    :param iterables: An iterable of iterables, each sorted by key
+    :param key: A function of one argument that returns the sort key of an
+                item, it is called exactly once per item
+    :param dedupe: A boolean, True to yield only the first of consecutive
+                   items with equal keys
+    :rtype: A generator of sorted items
+    """
+    heap = []
+    for index, iterable in enumerate(iterables):
+        source = iter(iterable)
+        for item in source:
+            heap.append([item if key is None else key(item), index, item,
+                         source])
+            break
+    heapq.heapify(heap)
+
+    replace = heapq.heapreplace
+    last = None
+    while heap:
+        entry = heap[0]
+        k, _, item, source = entry
+        if not dedupe:
+            yield item
+        elif last is None or last[0] < k:
+            last = (k,)
+            yield item
+
+        for item in source:
+            entry[0] = item if key is None else key(item)
+            entry[2] = item
+            replace(heap, entry)
+            break
+        else:
+            heapq.heappop(heap)
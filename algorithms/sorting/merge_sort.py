@@ -11,7 +11,27 @@
 
     Psuedo Code: CLRS. Introduction to Algorithms. 3rd ed.
 
+    NumPy arrays and numeric `array.array` objects are copied and the copy
+    is sorted by `numpy_backend.merge_sort` when NumPy is installed, so that
+    like a list the input is left unchanged and a new list is returned.
+
+    Bottom-Up Merge Sort
+    --------------------
+    `bottom_up_sort` is an index based variant that never slices the list.
+    Small blocks are insertion sorted, then runs of doubling width are
+    merged back and forth between the list and one preallocated buffer of
+    the same size. A merge is replaced by a plain copy when the two runs are
+    already in order. NumPy arrays and numeric `array.array` objects are
+    sorted in place by `numpy_backend.merge_sort`.
+
+    Time Complexity: O(n log n), O(n) on sorted input
+
+    Space Complexity: O(n) Auxiliary, allocated once
+
 """
+from algorithms.sorting import numpy_backend, utils
+
+INSERTION_SORT_THRESHOLD = 16
 
 
 def merge(left, right):
@@ -25,7 +45,8 @@ def merge(left, right):
     """
     result = []
     n, m = 0, 0
-    while n < len(left) and m < len(right):
+    left_len, right_len = len(left), len(right)
+    while n < left_len and m < right_len:
         if left[n] <= right[m]:
             result.append(left[n])
             n += 1
@@ -38,14 +59,24 @@ def merge(left, right):
     return result
 
 
-def sort(seq):
+def sort(seq, key=None, reverse=False):
     """
     Takes a list of integers and sorts them in ascending order. This sorted
     list is then returned.
 
     :param seq: A list of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
     :rtype: A list of sorted integers
     """
+    buf = numpy_backend.as_buffer(seq) if key is None else None
+    if buf is not None:
+        buf = buf.copy()
+        numpy_backend.merge_sort(buf, reverse)
+        return buf.tolist()
+    if key is not None or reverse:
+        return utils.keyed_sort(sort, seq, key, reverse)
     if len(seq) <= 1:
         return seq
 
@@ -53,3 +84,102 @@ def sort(seq):
     left = sort(seq[:middle])
     right = sort(seq[middle:])
     return merge(left, right)
+
+
+def argsort(seq, key=None, reverse=False):
+    """
+    Returns the permutation of indices that sorts seq. seq is not modified.
+
+    :param seq: A list of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of indices
+    """
+    return utils.argsort(sort, seq, key, reverse)
+
+
+def _copy(src, dst, i, k, n):
+    # Copies src[i:i + n] to dst[k:k + n] element by element, without the
+    # temporary list that a slice copy would build.
+    offset = i - k
+    for d in range(k, k + n):
+        dst[d] = src[d + offset]
+
+
+def merge_into(src, dst, lo, mid, hi):
+    """
+    Merges the sorted runs src[lo:mid] and src[mid:hi] in to dst[lo:hi].
+
+    :param src: A list holding the two sorted runs
+    :param dst: A list of the same length to write the merged run in to
+    :param lo: An integer representing the start of the left run
+    :param mid: An integer representing the start of the right run
+    :param hi: An integer representing the end of the right run
+    """
+    if src[mid - 1] <= src[mid]:
+        _copy(src, dst, lo, lo, hi - lo)
+        return
+    i, j = lo, mid
+    for k in range(lo, hi):
+        if src[j] < src[i]:
+            dst[k] = src[j]
+            j += 1
+            if j == hi:
+                _copy(src, dst, i, k + 1, mid - i)
+                return
+        else:
+            dst[k] = src[i]
+            i += 1
+            if i == mid:
+                _copy(src, dst, j, k + 1, hi - j)
+                return
+
+
+def bottom_up_sort(seq, key=None, reverse=False):
+    """
+    Takes a list of integers and sorts them in ascending order in place,
+    using a single auxiliary buffer. This sorted list is then returned.
+
+    :param seq: A list of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of sorted integers
+    """
+    buf = numpy_backend.as_buffer(seq) if key is None else None
+    if buf is not None:
+        numpy_backend.merge_sort(buf, reverse)
+        return seq
+    if key is not None or reverse:
+        utils.assign(seq, utils.keyed_sort(bottom_up_sort, seq, key, reverse))
+        return seq
+    n = len(seq)
+    if n <= 1:
+        return seq
+
+    width = INSERTION_SORT_THRESHOLD
+    for lo in range(0, n, width):
+        for i in range(lo + 1, min(lo + width, n)):
+            item = seq[i]
+            hole = i
+            while hole > lo and seq[hole - 1] > item:
+                seq[hole] = seq[hole - 1]
+                hole -= 1
+            seq[hole] = item
+
+    src, dst = seq, seq[:]
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            if mid < hi:
+                merge_into(src, dst, lo, mid, hi)
+            else:
+                _copy(src, dst, lo, lo, hi - lo)
+        src, dst = dst, src
+        width *= 2
+
+    if src is not seq:
+        seq[:] = src
+    return seq
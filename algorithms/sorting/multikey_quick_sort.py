@@ -0,0 +1,139 @@
+"""
+    Multikey Quick Sort
+    -------------------
+    A string sort, also called three-way radix quick sort. A range of
+    strings that share their first `depth` characters is partitioned in to
+    three groups by the characters from `depth` of a pivot string: smaller,
+    equal and bigger. The smaller and bigger groups are partitioned again
+    at the same depth, and only the equal group moves on to the next
+    characters, so a shared prefix is examined once per string instead of
+    once per comparison.
+
+    Each step compares a chunk of CHUNK characters rather than a single
+    one. Slices compare in C, so in CPython a wider chunk costs about the
+    same as one character and cuts the number of partitioning passes over
+    long shared prefixes such as URLs or paths.
+
+    The longest common prefix (LCP) of adjacent strings in the output is a
+    by-product: two neighbours that were split apart at depth d share at
+    least d characters, and the exact value is found with one binary search
+    over slice comparisons once they are final. `sort_with_lcp` returns
+    those values in the format of
+    `algorithms.data_structures.lcp_array.lcp_array`, where lcp[i] is the
+    LCP of the i-th and (i + 1)-th sorted strings and the last entry is 0.
+
+    Time Complexity: O(n log n + D) character comparisons on average, for
+                     D the total length of the distinguishing prefixes
+
+    Space Complexity: O(log n) Auxiliary, plus the LCP list
+
+    Stable: No
+
+    Psuedo Code: Bentley, J. and Sedgewick, R. Fast Algorithms for Sorting
+                 and Searching Strings. SODA 1997.
+
+"""
+from random import randrange
+
+INSERTION_SORT_THRESHOLD = 16
+CHUNK = 16
+
+
+def common_prefix(a, b, depth=0):
+    """
+    Returns the length of the longest common prefix of a and b, knowing
+    that they share at least their first depth characters.
+
+    :param a: A string
+    :param b: A string
+    :param depth: An integer number of characters known to be shared
+    :rtype: An integer length
+    """
+    # Binary search on slice equality, which is a memcmp in C.
+    lo = depth
+    hi = min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def sort_with_lcp(seq):
+    """
+    Takes a list of strings (str or bytes) and sorts them in place in
+    ascending lexicographic order. Returns the LCP of every pair of
+    adjacent strings in the sorted list.
+
+    :param seq: A list of strings
+    :rtype: A list of integers, lcp[i] for seq[i] and seq[i + 1]
+    """
+    n = len(seq)
+    lcp = [0] * n
+    # Every string in a range shares its first `depth` characters. Slices
+    # are shorter past the end of a string, which orders shorter strings
+    # first for both str and bytes.
+    stack = [(0, n, 0)] if n > 1 else []
+    while stack:
+        lo, hi, depth = stack.pop()
+        if hi - lo < INSERTION_SORT_THRESHOLD:
+            for i in range(lo + 1, hi):
+                item = seq[i]
+                j = i
+                while j > lo and seq[j - 1] > item:
+                    seq[j] = seq[j - 1]
+                    j -= 1
+                seq[j] = item
+            for i in range(lo, hi - 1):
+                lcp[i] = common_prefix(seq[i], seq[i + 1], depth)
+            continue
+
+        end = depth + CHUNK
+        pivot = seq[randrange(lo, hi)][depth:end]
+        lt, i, gt = lo, lo, hi
+        while i < gt:
+            c = seq[i][depth:end]
+            if c < pivot:
+                seq[lt], seq[i] = seq[i], seq[lt]
+                lt += 1
+                i += 1
+            elif pivot < c:
+                gt -= 1
+                seq[gt], seq[i] = seq[i], seq[gt]
+            else:
+                i += 1
+
+        # Neighbours on either side of a group boundary share at least
+        # `depth` characters; the exact LCP is found once they are final,
+        # and marked until then as -1 - depth.
+        if lt > lo:
+            lcp[lt - 1] = -1 - depth
+            stack.append((lo, lt, depth))
+        if gt < hi:
+            lcp[gt - 1] = -1 - depth
+            stack.append((gt, hi, depth))
+        if len(pivot) == CHUNK:
+            stack.append((lt, gt, end))
+        else:
+            # These strings all end inside the chunk and are equal.
+            for i in range(lt, gt - 1):
+                lcp[i] = depth + len(pivot)
+
+    for i in range(n - 1):
+        if lcp[i] < 0:
+            lcp[i] = common_prefix(seq[i], seq[i + 1], -1 - lcp[i])
+    return lcp
+
+
+def sort(seq):
+    """
+    Takes a list of strings and sorts them in ascending lexicographic
+    order. This sorted list is then returned.
+
+    :param seq: A list of strings
+    :rtype: A list of sorted strings
+    """
+    sort_with_lcp(seq)
+    return seq
@@ -0,0 +1,267 @@
+"""
+    Natural Merge Sort
+    ------------------
+    An adaptive merge sort in the style of Timsort. The list is scanned for
+    runs that are already ascending or strictly descending (the latter are
+    reversed in place), short runs are extended to a minimum length with
+    binary insertion sort, and the runs are merged from a stack whose
+    invariants keep the merges balanced. Merges switch to galloping when one
+    run keeps winning, so long stretches of presorted data are copied in
+    bulk.
+
+    Time Complexity: O(n log n) worst case, O(n) on presorted input
+
+    Space Complexity: O(n) Auxiliary
+
+    Stable: Yes
+
+    Psuedo Code: https://en.wikipedia.org/wiki/Timsort
+
+"""
+from bisect import bisect_left, bisect_right
+
+from algorithms.sorting import utils
+
+MIN_GALLOP = 7
+
+
+def min_run_length(n):
+    """
+    Returns the minimum run length for a list of length n. It is chosen so
+    that n / min_run is a power of two, or slightly less than one, which
+    keeps the final merges balanced.
+
+    :param n: An integer length of the list
+    :rtype: An integer between 32 and 64 for n >= 64
+    """
+    r = 0
+    while n >= 64:
+        r |= n & 1
+        n >>= 1
+    return n + r
+
+
+def count_run(seq, lo, hi):
+    """
+    Returns the end index of the run that starts at seq[lo]. A strictly
+    descending run is reversed in place so that every run is ascending.
+    Descending runs must be strict, otherwise reversing them would swap
+    equal elements and break stability.
+
+    :param seq: A list of integers
+    :param lo: An integer representing the start of the run
+    :param hi: An integer representing the end of the list
+    :rtype: An integer index one past the end of the run
+    """
+    run_hi = lo + 1
+    if run_hi == hi:
+        return hi
+    if seq[run_hi] < seq[lo]:
+        run_hi += 1
+        while run_hi < hi and seq[run_hi] < seq[run_hi - 1]:
+            run_hi += 1
+        seq[lo:run_hi] = seq[lo:run_hi][::-1]
+    else:
+        run_hi += 1
+        while run_hi < hi and not seq[run_hi] < seq[run_hi - 1]:
+            run_hi += 1
+    return run_hi
+
+
+def binary_insertion_sort(seq, lo, hi, start):
+    """
+    Sorts seq[lo:hi] in place given that seq[lo:start] is already sorted.
+
+    :param seq: A list of integers
+    :param lo: An integer representing the beginning index
+    :param hi: An integer representing the end index
+    :param start: An integer index of the first unsorted element
+    """
+    for i in range(start, hi):
+        item = seq[i]
+        pos = bisect_right(seq, item, lo, i)
+        seq[pos + 1:i + 1] = seq[pos:i]
+        seq[pos] = item
+
+
+def gallop_left(key, seq, lo, hi):
+    """
+    Exponential search for the leftmost position in the sorted slice
+    seq[lo:hi] where `key` could be inserted. Probes lo, lo + 1, lo + 3,
+    lo + 7, ... and then binary searches the final bracket, so finding a
+    position k elements in costs O(log k).
+
+    :param key: The value being searched for
+    :param seq: A list of sorted integers
+    :param lo: An integer representing the beginning index
+    :param hi: An integer representing the end index
+    :rtype: An integer insertion point
+    """
+    probe = lo
+    step = 1
+    while probe < hi and seq[probe] < key:
+        lo = probe + 1
+        probe = lo + step
+        step *= 2
+    return bisect_left(seq, key, lo, min(probe, hi))
+
+
+def gallop_right(key, seq, lo, hi):
+    """
+    Same as `gallop_left` but returns the rightmost insertion point, i.e.
+    the position after any elements equal to `key`.
+
+    :param key: The value being searched for
+    :param seq: A list of sorted integers
+    :param lo: An integer representing the beginning index
+    :param hi: An integer representing the end index
+    :rtype: An integer insertion point
+    """
+    probe = lo
+    step = 1
+    while probe < hi and not key < seq[probe]:
+        lo = probe + 1
+        probe = lo + step
+        step *= 2
+    return bisect_right(seq, key, lo, min(probe, hi))
+
+
+def merge(seq, lo, mid, hi):
+    """
+    Merges the adjacent sorted runs seq[lo:mid] and seq[mid:hi] in place,
+    using a copy of the left run as the only temporary storage.
+
+    :param seq: A list of integers
+    :param lo: An integer representing the start of the left run
+    :param mid: An integer representing the start of the right run
+    :param hi: An integer representing the end of the right run
+    """
+    # Elements of the left run that are no bigger than the first element of
+    # the right run, and elements of the right run that are no smaller than
+    # the last element of the left run, are already in place.
+    lo = gallop_right(seq[mid], seq, lo, mid)
+    if lo == mid:
+        return
+    hi = gallop_left(seq[mid - 1], seq, mid, hi)
+
+    tmp = seq[lo:mid]
+    n = len(tmp)
+    i, j, k = 0, mid, lo
+    while i < n and j < hi:
+        left_wins = right_wins = 0
+        while i < n and j < hi:
+            if seq[j] < tmp[i]:
+                seq[k] = seq[j]
+                j += 1
+                right_wins += 1
+                left_wins = 0
+            else:
+                seq[k] = tmp[i]
+                i += 1
+                left_wins += 1
+                right_wins = 0
+            k += 1
+            if left_wins >= MIN_GALLOP or right_wins >= MIN_GALLOP:
+                break
+
+        # Galloping mode: copy whole stretches found by exponential search.
+        if i < n and j < hi:
+            end = gallop_left(tmp[i], seq, j, hi)
+            seq[k:k + end - j] = seq[j:end]
+            k += end - j
+            j = end
+        if i < n and j < hi:
+            end = gallop_right(seq[j], tmp, i, n)
+            seq[k:k + end - i] = tmp[i:end]
+            k += end - i
+            i = end
+    # Whatever is left of the right run is already in place.
+    seq[k:k + n - i] = tmp[i:]
+
+
+def merge_at(seq, runs, i):
+    """
+    Merges the runs at positions i and i + 1 of the run stack.
+
+    :param seq: A list of integers
+    :param runs: A list of [start, length] pairs
+    :param i: An integer index in to the run stack
+    """
+    start, length = runs[i]
+    next_length = runs[i + 1][1]
+    merge(seq, start, start + length, start + length + next_length)
+    runs[i][1] = length + next_length
+    del runs[i + 1]
+
+
+def merge_collapse(seq, runs):
+    """
+    Merges runs until the lengths on the stack satisfy A > B + C and B > C
+    for every three consecutive runs A, B, C. This keeps the run lengths
+    growing at least as fast as the Fibonacci numbers, so the stack stays
+    O(log n) deep and runs of similar length are merged together.
+
+    :param seq: A list of integers
+    :param runs: A list of [start, length] pairs
+    """
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if ((n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or
+                (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1])):
+            if runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+        elif runs[n][1] > runs[n + 1][1]:
+            break
+        merge_at(seq, runs, n)
+
+
+def sort(seq, key=None, reverse=False):
+    """
+    Takes a list of integers and sorts them in ascending order. This sorted
+    list is then returned.
+
+    :param seq: A list of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of sorted integers
+    """
+    if key is not None or reverse:
+        seq[:] = utils.keyed_sort(sort, seq, key, reverse)
+        return seq
+    n = len(seq)
+    if n < 2:
+        return seq
+
+    min_run = min_run_length(n)
+    runs = []
+    lo = 0
+    while lo < n:
+        hi = count_run(seq, lo, n)
+        if hi - lo < min_run:
+            forced = min(lo + min_run, n)
+            binary_insertion_sort(seq, lo, forced, hi)
+            hi = forced
+        runs.append([lo, hi - lo])
+        merge_collapse(seq, runs)
+        lo = hi
+
+    while len(runs) > 1:
+        n = len(runs) - 2
+        if n > 0 and runs[n - 1][1] < runs[n + 1][1]:
+            n -= 1
+        merge_at(seq, runs, n)
+    return seq
+
+
+def argsort(seq, key=None, reverse=False):
+    """
+    Returns the permutation of indices that sorts seq. seq is not modified.
+
+    :param seq: A list of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of indices
+    """
+    return utils.argsort(sort, seq, key, reverse)
@@ -0,0 +1,347 @@
+"""
+    NumPy Backend
+    -------------
+    Vectorized versions of merge, quick, heap and radix sort for
+    one-dimensional numeric buffers: NumPy arrays and `array.array` objects,
+    which are viewed through the buffer protocol without copying. The sorts
+    work on the buffer in place; each step of an algorithm is applied to
+    every element at once instead of looping element by element in Python.
+
+    `merge_sort` sorts small blocks with a vectorized odd-even transposition
+    network and then merges pairs of runs bottom up. Every element of a run
+    finds its place in the merged run with one vectorized binary search in
+    the other run.
+
+    `quick_sort` partitions breadth first: every unfinished segment is split
+    around its own random pivot in the same pass, so the number of passes is
+    the depth of the recursion rather than the number of partitions.
+
+    `heap_sort` builds the heap one level at a time, sifting every node of a
+    level down together since their subtrees do not overlap. Removing the
+    maximum is inherently sequential and is done on a list.
+
+    `bucket_sort` groups the elements by their bucket numbers with a
+    counting sort and then sorts all buckets at once with odd-even
+    transposition rounds over the whole array.
+
+    `radix_sort` maps integers and floats to unsigned 64 bit keys that sort
+    in the same order and runs LSD passes over 8 bit digits.
+
+    The sorting modules call `as_buffer` first and use these functions when
+    it returns a buffer. Without NumPy, `as_buffer` always returns None and
+    they keep their pure Python code.
+
+"""
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+NUMERIC_TYPECODES = 'bBhHiIlLqQfd'
+BLOCK_SIZE = 128
+MAX_BUCKET_SIZE = 64
+RADIX_BITS = 8
+
+
+def as_buffer(seq):
+    """
+    Returns a writable one-dimensional NumPy view of seq if it is a numeric
+    NumPy array or `array.array`, otherwise None.
+
+    :param seq: Any sequence
+    :rtype: A NumPy array sharing memory with seq, or None
+    """
+    if np is None:
+        return None
+    if isinstance(seq, np.ndarray):
+        buf = seq
+    elif isinstance(seq, array) and seq.typecode in NUMERIC_TYPECODES:
+        buf = np.frombuffer(seq, dtype=seq.typecode)
+    else:
+        return None
+    if (buf.ndim != 1 or buf.dtype.kind not in 'iuf' or
+            not buf.flags.writeable):
+        return None
+    return buf
+
+
+def _reverse(buf):
+    buf[:] = buf[::-1].copy()
+
+
+def compare_exchange(a, b):
+    """
+    Swaps a[i] and b[i] wherever b[i] belongs before a[i], so that a ends up
+    holding the smaller element of every pair. NaN counts as bigger than
+    every number, as in `numpy.sort`, and equal elements such as 0.0 and
+    -0.0 are never swapped.
+
+    :param a: A NumPy array, usually a view of the buffer being sorted
+    :param b: A NumPy array of the same shape as a
+    """
+    swap = b < a
+    if a.dtype.kind == 'f':
+        swap |= np.isnan(a) & ~np.isnan(b)
+    a[swap], b[swap] = b[swap], a[swap]
+
+
+def network_sort_rows(rows):
+    """
+    Sorts every row of a 2-D array in place with an odd-even transposition
+    network: as many rounds as there are columns, each one a vectorized
+    compare-exchange of neighbouring columns.
+
+    :param rows: A 2-D NumPy array
+    """
+    width = rows.shape[1]
+    for r in range(width):
+        a = rows[:, r % 2:width - 1:2]
+        b = rows[:, r % 2 + 1:width:2]
+        compare_exchange(a, b)
+
+
+def _merge_pass(src, dst, width):
+    n = len(src)
+    for lo in range(0, n, 2 * width):
+        mid = min(lo + width, n)
+        hi = min(lo + 2 * width, n)
+        left, right = src[lo:mid], src[mid:hi]
+        # Every element moves forward by the number of elements of the
+        # other run that go before it; equal elements of the left run first.
+        dst[lo + np.arange(mid - lo) +
+            np.searchsorted(right, left, 'left')] = left
+        dst[lo + np.arange(hi - mid) +
+            np.searchsorted(left, right, 'right')] = right
+
+
+def merge_sort(buf, reverse=False):
+    """
+    Sorts a NumPy buffer in place in ascending order.
+
+    :param buf: A one-dimensional NumPy array
+    :param reverse: A boolean, True to sort in descending order
+    """
+    n = len(buf)
+    if n > 1:
+        full = n - n % BLOCK_SIZE
+        if full:
+            blocks = buf[:full].reshape(-1, BLOCK_SIZE)
+            network_sort_rows(blocks)
+            buf[:full] = blocks.ravel()
+        if full < n:
+            tail = buf[full:].reshape(1, -1)
+            network_sort_rows(tail)
+            buf[full:] = tail.ravel()
+
+        src, dst = buf, np.empty_like(buf)
+        width = BLOCK_SIZE
+        while width < n:
+            _merge_pass(src, dst, width)
+            src, dst = dst, src
+            width *= 2
+        if src is not buf:
+            buf[:] = src
+    if reverse:
+        _reverse(buf)
+
+
+def quick_sort(buf, reverse=False):
+    """
+    Sorts a NumPy buffer in place in ascending order. A NaN pivot would
+    compare equal to nothing, so floats with NaNs are radix sorted instead.
+
+    :param buf: A one-dimensional NumPy array
+    :param reverse: A boolean, True to sort in descending order
+    """
+    if buf.dtype.kind == 'f' and np.isnan(buf).any():
+        radix_sort(buf, reverse)
+        return
+    n = len(buf)
+    head = np.zeros(n, dtype=bool)
+    head[:1] = True
+    active = np.arange(n) if n > 1 else np.arange(0)
+    while len(active):
+        values = buf[active]
+        local_head = head[active]
+        segment = np.cumsum(local_head) - 1
+        starts = np.flatnonzero(local_head)
+        sizes = np.diff(np.append(starts, len(active)))
+        pivots = values[starts + np.random.randint(0, sizes)]
+
+        # Class 0, 1 or 2 for smaller than, equal to or bigger than the
+        # pivot; the groups of a segment are laid out in that order.
+        pivot = pivots[segment]
+        cls = (values >= pivot).astype(np.intp) + (values > pivot)
+        group = 3 * segment + cls
+        counts = np.bincount(group, minlength=3 * len(starts))
+        group_start = np.cumsum(counts) - counts
+        rank = np.empty(len(active), dtype=np.intp)
+        for c in range(3):
+            mask = cls == c
+            seen = np.cumsum(mask) - mask
+            rank[mask] = (seen - seen[starts][segment])[mask]
+        position = group_start[group] + rank
+        buf[active[position]] = values
+
+        head[active[group_start[counts > 0]]] = True
+        # Equal groups and groups of one element are in place.
+        unfinished = np.empty(len(active), dtype=bool)
+        unfinished[position] = (cls != 1) & (counts[group] > 1)
+        active = active[unfinished]
+    if reverse:
+        _reverse(buf)
+
+
+def heap_sort(buf, reverse=False):
+    """
+    Sorts a NumPy buffer in place in ascending order.
+
+    :param buf: A one-dimensional NumPy array
+    :param reverse: A boolean, True to sort in descending order
+    """
+    n = len(buf)
+    depth = n.bit_length() - 1
+    for level in range(depth - 1, -1, -1):
+        node = np.arange((1 << level) - 1, min((2 << level) - 1, n // 2))
+        while len(node):
+            child = 2 * node + 1
+            keep = child < n
+            node, child = node[keep], child[keep]
+            right = child + 1
+            use_right = right < n
+            use_right[use_right] = (buf[right[use_right]] >
+                                    buf[child[use_right]])
+            child = np.where(use_right, right, child)
+            swap = buf[child] > buf[node]
+            node, child = node[swap], child[swap]
+            buf[node], buf[child] = buf[child], buf[node]
+            node = child
+
+    seq = buf.tolist()
+    for end in range(n - 1, 0, -1):
+        item = seq[end]
+        seq[end] = seq[0]
+        hole = 0
+        child = 1
+        while child < end:
+            if child + 1 < end and seq[child + 1] > seq[child]:
+                child += 1
+            if seq[child] <= item:
+                break
+            seq[hole] = seq[child]
+            hole = child
+            child = 2 * hole + 1
+        seq[hole] = item
+    buf[:] = seq
+    if reverse:
+        _reverse(buf)
+
+
+def bucket_sort(buf, ids, reverse=False):
+    """
+    Sorts a NumPy buffer in place in ascending order, given the bucket of
+    every element. If a bucket holds more than `MAX_BUCKET_SIZE` elements,
+    the buffer is radix sorted instead.
+
+    :param buf: A one-dimensional NumPy array
+    :param ids: A NumPy array of the non-negative integer bucket of every
+                element of buf, such that smaller elements are never in
+                higher buckets
+    :param reverse: A boolean, True to sort in descending order
+    """
+    n = len(buf)
+    if n > 1:
+        counts = np.bincount(ids)
+        buckets = len(counts)
+        width = int(counts.max())
+        if width > MAX_BUCKET_SIZE:
+            radix_sort(buf, reverse)
+            return
+
+        shifts = range(0, buckets.bit_length(), RADIX_BITS)
+        _, perm = radix_passes(ids.astype(np.uint64), shifts)
+        grouped = buf[perm]
+        # The buckets are in order, so odd-even transposition over the
+        # whole array only ever swaps inside a bucket. A bucket of `width`
+        # elements is sorted after `width` rounds, or as soon as two rounds
+        # in a row swap nothing.
+        quiet = 0
+        for r in range(width):
+            a = grouped[r % 2:n - 1:2]
+            b = grouped[r % 2 + 1:n:2]
+            swap = a > b
+            if swap.any():
+                quiet = 0
+                a[swap], b[swap] = b[swap], a[swap]
+            else:
+                quiet += 1
+                if quiet == 2:
+                    break
+        buf[:] = grouped
+    if reverse:
+        _reverse(buf)
+
+
+def radix_passes(keys, shifts, mask=(1 << RADIX_BITS) - 1):
+    """
+    Runs one stable counting sort pass of an LSD radix sort for every shift
+    in shifts, skipping passes where every key has the same digit.
+
+    :param keys: A NumPy array of unsigned 64 bit integers
+    :param shifts: An iterable of bit offsets, least significant first
+    :param mask: An integer mask of the bits in one digit
+    :rtype: A tuple of the sorted keys and the permutation that sorts them
+    """
+    n = len(keys)
+    perm = np.arange(n)
+    for shift in shifts:
+        digits = ((keys >> np.uint64(shift)) & np.uint64(mask)).astype(
+            np.uint8 if mask < 1 << 8 else np.uint16)
+        if np.bincount(digits).max() == n:
+            continue
+        # A stable argsort of 8 bit integers is itself a counting sort in
+        # NumPy, so this is the vectorized scatter of the pass.
+        order = np.argsort(digits, kind='stable')
+        keys = keys[order]
+        perm = perm[order]
+    return keys, perm
+
+
+def radix_sort(buf, reverse=False):
+    """
+    Sorts a NumPy buffer of integers or floats in place in ascending order.
+    Floats are sorted by their IEEE 754 bits, so NaNs go to the end (or the
+    beginning, if their sign bit is set).
+
+    :param buf: A one-dimensional NumPy array
+    :param reverse: A boolean, True to sort in descending order
+    """
+    n = len(buf)
+    if n > 1:
+        sign = np.uint64(1 << 63)
+        kind = buf.dtype.kind
+        if kind == 'f':
+            bits = buf.astype(np.float64).view(np.uint64)
+            keys = np.where(bits & sign, ~bits, bits | sign)
+        elif kind == 'i':
+            keys = buf.astype(np.int64).view(np.uint64) ^ sign
+        else:
+            keys = buf.astype(np.uint64)
+
+        lo = keys.min()
+        keys -= lo
+        shifts = range(0, int(keys.max()).bit_length(), RADIX_BITS)
+        keys, _ = radix_passes(keys, shifts)
+        keys += lo
+
+        if kind == 'f':
+            bits = np.where(keys & sign, keys ^ sign, ~keys)
+            buf[:] = bits.view(np.float64)
+        elif kind == 'i':
+            buf[:] = (keys ^ sign).view(np.int64)
+        else:
+            buf[:] = keys
+    if reverse:
+        _reverse(buf)
@@ -0,0 +1,201 @@
+"""
+    Parallel Merge Sort
+    -------------------
+    A merge sort for numeric data that uses every core. The input is copied
+    once into a shared memory buffer. Worker processes sort equal partitions
+    of the buffer, then the sorted runs are merged pairwise in rounds. Every
+    merge is split in to independent pieces with a co-rank binary search so
+    that all workers stay busy even in the final round. Workers only ever
+    receive buffer names and index ranges, never the data itself.
+
+    Time Complexity: O((n log n) / p + n log p)
+
+    Space Complexity: O(n) Auxiliary
+
+    Stable: Yes
+
+    Psuedo Code: https://en.wikipedia.org/wiki/Merge_sort#Parallel_merge_sort
+
+"""
+from array import array
+import multiprocessing
+
+try:
+    from multiprocessing import shared_memory
+except ImportError:
+    shared_memory = None
+
+from algorithms.sorting import merge_sort
+
+
+def co_rank(t, seq, left, middle, right):
+    """
+    Finds how many of the first `t` merged elements come from the left run
+    seq[left:middle] when it is merged with the right run seq[middle:right].
+    Ties are taken from the left run first, which keeps the merge stable.
+
+    :param t: An integer count of merged elements
+    :param seq: A sequence holding both sorted runs
+    :param left: An integer representing the start of the left run
+    :param middle: An integer representing the start of the right run
+    :param right: An integer representing the end of the right run
+    :rtype: The number of elements taken from the left run
+    """
+    lo = max(0, t - (right - middle))
+    hi = min(t, middle - left)
+    while lo < hi:
+        i = (lo + hi) // 2
+        if seq[left + i] <= seq[middle + t - i - 1]:
+            lo = i + 1
+        else:
+            hi = i
+    return lo
+
+
+def _buffer(seq, typecode):
+    """
+    Copies seq in to an array of the given typecode, or returns None if
+    some element would not come back out of it unchanged: ints too big
+    for the typecode, ints stored as floats, bools, subclasses and floats
+    that lose precision.
+    """
+    try:
+        data = array(typecode, seq)
+    except (OverflowError, TypeError):
+        return None
+    for x, y in zip(seq, data):
+        # x != x lets NaN through, which never equals itself.
+        if type(x) is not type(y) or not (x == y or x != x):
+            return None
+    return data
+
+
+def _attach(name, typecode):
+    block = shared_memory.SharedMemory(name=name)
+    return block, block.buf.cast(typecode)
+
+
+def _sort_partition(task):
+    name, typecode, lo, hi = task
+    block, view = _attach(name, typecode)
+    try:
+        view[lo:hi] = array(typecode, merge_sort.sort(view[lo:hi].tolist()))
+    finally:
+        view.release()
+        block.close()
+
+
+def _merge_piece(task):
+    src_name, dst_name, typecode, a_lo, a_hi, b_lo, b_hi, out = task
+    src, src_view = _attach(src_name, typecode)
+    dst, dst_view = _attach(dst_name, typecode)
+    try:
+        merged = merge_sort.merge(src_view[a_lo:a_hi].tolist(),
+                                  src_view[b_lo:b_hi].tolist())
+        dst_view[out:out + len(merged)] = array(typecode, merged)
+    finally:
+        src_view.release()
+        dst_view.release()
+        src.close()
+        dst.close()
+
+
+def _merge_tasks(view, names, typecode, runs, pieces):
+    """
+    Splits the merge of each adjacent pair of runs in to `pieces`
+    independent tasks. A trailing unpaired run is copied as a single piece.
+    """
+    tasks = []
+    merged_runs = []
+    for r in range(0, len(runs) - 1, 2):
+        left, middle = runs[r]
+        right = runs[r + 1][1]
+        size = right - left
+        cuts = [co_rank(size * k // pieces, view, left, middle, right)
+                for k in range(pieces + 1)]
+        for k in range(pieces):
+            t_lo, t_hi = size * k // pieces, size * (k + 1) // pieces
+            if t_lo == t_hi:
+                continue
+            i_lo, i_hi = cuts[k], cuts[k + 1]
+            tasks.append(names + (typecode,
+                                  left + i_lo, left + i_hi,
+                                  middle + t_lo - i_lo, middle + t_hi - i_hi,
+                                  left + t_lo))
+        merged_runs.append((left, right))
+    if len(runs) % 2:
+        left, right = runs[-1]
+        tasks.append(names + (typecode, left, right, right, right, left))
+        merged_runs.append((left, right))
+    return tasks, merged_runs
+
+
+def sort(seq, processes=None, typecode=None):
+    """
+    Takes a list of numbers and sorts them in ascending order using a pool
+    of worker processes. A new sorted list is returned.
+
+    Falls back to a single process merge sort when shared memory is not
+    available on this Python, or when the elements cannot be stored in the
+    shared buffer without changing them, such as ints beyond 64 bits or a
+    mix of ints and floats.
+
+    :param seq: A list of integers or floats
+    :param processes: The number of worker processes, defaults to the number
+                      of CPUs
+    :param typecode: The `array` typecode used for the shared buffer,
+                     defaults to 'q' for integers and 'd' otherwise
+    :rtype: A list of sorted numbers
+    :raises TypeError: If typecode is given and some element does not fit
+                       in it exactly
+    """
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    n = len(seq)
+    processes = max(1, min(processes, n))
+    # An explicit typecode is checked even when the fallback would not use
+    # it, so that the same call fails the same way on every Python.
+    if typecode is not None:
+        data = _buffer(seq, typecode)
+        if data is None:
+            raise TypeError("elements do not fit in typecode %r without "
+                            "loss" % typecode)
+    if shared_memory is None or processes == 1:
+        return merge_sort.sort(list(seq))
+
+    if typecode is None:
+        typecode = 'q' if all(type(x) is int for x in seq) else 'd'
+        data = _buffer(seq, typecode)
+        if data is None:
+            return merge_sort.sort(list(seq))
+    nbytes = n * array(typecode).itemsize
+    blocks = [shared_memory.SharedMemory(create=True, size=nbytes)
+              for _ in range(2)]
+    views = [block.buf.cast(typecode) for block in blocks]
+    try:
+        views[0][:n] = data
+        bounds = [n * k // processes for k in range(processes + 1)]
+        runs = list(zip(bounds, bounds[1:]))
+
+        pool = multiprocessing.Pool(processes)
+        try:
+            pool.map(_sort_partition,
+                     [(blocks[0].name, typecode, lo, hi) for lo, hi in runs])
+            src = 0
+            while len(runs) > 1:
+                pieces = max(1, processes // (len(runs) // 2))
+                names = (blocks[src].name, blocks[1 - src].name)
+                tasks, runs = _merge_tasks(views[src], names, typecode,
+                                           runs, pieces)
+                pool.map(_merge_piece, tasks)
+                src = 1 - src
+        finally:
+            pool.close()
+            pool.join()
+        return views[src][:n].tolist()
+    finally:
+        for view in views:
+            view.release()
+        for block in blocks:
+            block.close()
+            block.unlink()
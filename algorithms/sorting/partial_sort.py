@@ -0,0 +1,112 @@
+"""
+    Partial Sort
+    ------------
+    Finds the k smallest or largest elements without sorting everything.
+
+    `smallest` and `largest` stream over any iterable while keeping only a
+    bounded heap of the k best elements seen so far. Every new element is
+    compared with the root of the heap, the worst of the current k, and
+    only replaces it when it is better. `partial_sort` does the same inside
+    a list, leaving its k smallest elements sorted at the front.
+
+    Time Complexity: O(n log k)
+
+    Space Complexity: O(k) Auxiliary
+
+    Stable: Yes for `smallest` and `largest`, No for `partial_sort`
+
+    Psuedo Code: https://en.wikipedia.org/wiki/Partial_sorting
+
+"""
+from itertools import islice
+
+from algorithms.sorting import heap_sort
+
+
+def smallest(iterable, k, key=None):
+    """
+    Returns the k smallest elements of iterable in ascending order. Elements
+    with equal keys are returned in the order they arrived.
+
+    :param iterable: An iterable of elements
+    :param k: An integer number of elements to return
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :rtype: A list of at most k sorted elements
+    """
+    if k <= 0:
+        return []
+    it = iter(iterable)
+    # Entries are (key, index, element) and the heap is a max-heap, so the
+    # root is the worst entry and the latest of any equal keys.
+    heap = [(x if key is None else key(x), i, x)
+            for i, x in enumerate(islice(it, k))]
+    size = len(heap)
+    heap_sort.build_heap(heap, size, heap_sort.ARITY)
+    if size == k:
+        worst = heap[0][0]
+        for i, x in enumerate(it, k):
+            kx = x if key is None else key(x)
+            if kx < worst:
+                heap[0] = (kx, i, x)
+                heap_sort.sift_down(heap, 0, k, heap_sort.ARITY)
+                worst = heap[0][0]
+    heap_sort.sort_range(heap, 0, size, heap_sort.ARITY)
+    return [x for _, _, x in heap]
+
+
+def largest(iterable, k, key=None):
+    """
+    Returns the k largest elements of iterable in descending order. Elements
+    with equal keys are returned in the order they arrived.
+
+    :param iterable: An iterable of elements
+    :param k: An integer number of elements to return
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :rtype: A list of at most k elements sorted in descending order
+    """
+    if k <= 0:
+        return []
+    it = iter(iterable)
+    # A min-heap of (key, -index, element), so the root is the smallest key
+    # and, among equal keys, the one that arrived last.
+    heap = [(x if key is None else key(x), -i, x)
+            for i, x in enumerate(islice(it, k))]
+    size = len(heap)
+    heap_sort.build_heap(heap, size, heap_sort.ARITY,
+                         sift=heap_sort.min_sift_down)
+    if size == k:
+        worst = heap[0][0]
+        for i, x in enumerate(it, k):
+            kx = x if key is None else key(x)
+            if kx > worst:
+                heap[0] = (kx, -i, x)
+                heap_sort.min_sift_down(heap, 0, k, heap_sort.ARITY)
+                worst = heap[0][0]
+    heap_sort.sort_range(heap, 0, size, heap_sort.ARITY)
+    return [x for _, _, x in reversed(heap)]
+
+
+def partial_sort(seq, k):
+    """
+    Rearranges seq in place so that seq[:k] holds its k smallest elements
+    in ascending order. The order of the remaining elements is unspecified.
+
+    :param seq: A list of integers
+    :param k: An integer number of elements to sort
+    :rtype: The list, with its first k positions sorted
+    """
+    n = len(seq)
+    k = min(k, n)
+    if k <= 0:
+        return seq
+    heap_sort.build_heap(seq, k, heap_sort.ARITY)
+    worst = seq[0]
+    for i in range(k, n):
+        if seq[i] < worst:
+            seq[0], seq[i] = seq[i], worst
+            heap_sort.sift_down(seq, 0, k, heap_sort.ARITY)
+            worst = seq[0]
+    heap_sort.sort_range(seq, 0, k, heap_sort.ARITY)
+    return seq
@@ -1,7 +1,9 @@
 """
     Quick Sort
     ----------
-    Uses partitioning to recursively divide and sort the list
+    Uses partitioning to recursively divide and sort the list. Values equal
+    to the pivot are gathered in a middle list that is not sorted again, so
+    inputs with many duplicates do not unbalance the recursion.
 
     Time Complexity: O(n**2) worst case
 
@@ -12,24 +14,45 @@
     Psuedo Code: CLRS. Introduction to Algorithms. 3rd ed.
 
 """
+from algorithms.sorting import utils
 
 
-def sort(seq):
+def sort(seq, key=None, reverse=False):
     """
     Takes a list of integers and sorts them in ascending order. This sorted
     list is then returned.
 
     :param seq: A list of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
     :rtype: A list of sorted integers
     """
+    if key is not None or reverse:
+        return utils.keyed_sort(sort, seq, key, reverse)
     if len(seq) <= 1:
         return seq
     else:
         pivot = seq[0]
-        left, right = [], []
-        for x in seq[1:]:
+        left, middle, right = [], [], []
+        for x in seq:
             if x < pivot:
                 left.append(x)
-            else:
+            elif x > pivot:
                 right.append(x)
-        return sort(left) + [pivot] + sort(right)
+            else:
+                middle.append(x)
+        return sort(left) + middle + sort(right)
+
+
+def argsort(seq, key=None, reverse=False):
+    """
+    Returns the permutation of indices that sorts seq. seq is not modified.
+
+    :param seq: A list of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of indices
+    """
+    return utils.argsort(sort, seq, key, reverse)
@@ -1,7 +1,9 @@
 """
     Quick Sort in Place
     -------------------
-    Uses partitioning to recursively divide and sort the list
+    Uses partitioning to recursively divide and sort the list. `sort` uses a
+    three-way partition, so values equal to the pivot are never visited
+    again and duplicate-heavy inputs stay O(n log n).
 
     Time Complexity: O(n**2) worst case
 
@@ -11,9 +13,41 @@
 
     Psuedo Code: http://rosettacode.org/wiki/Quick_Sort
 
+    Dual-Pivot Quick Sort
+    ---------------------
+    `dual_pivot_sort` partitions around two pivots p <= q in to three
+    ranges, < p, between p and q, and > q, in a single pass.
+
+    Time Complexity: O(n**2) worst case
+
+    Space Complexity: O(log n) stack
+
+    Psuedo Code: http://en.wikipedia.org/wiki/Quicksort#Multi-pivot_quicksort
+
+    Introsort
+    ---------
+    `introsort` is an iterative variant that picks a median-of-three pivot,
+    keeps pending ranges on an explicit stack, hands small ranges to
+    insertion sort and falls back to heap sort once the partitioning gets
+    too deep.
+
+    Time Complexity: O(n log n) worst case
+
+    Space Complexity: O(log n) stack
+
+    Psuedo Code: http://en.wikipedia.org/wiki/Introsort
+
+    `sort` and `introsort` hand NumPy arrays and numeric `array.array`
+    objects to `numpy_backend.quick_sort` when NumPy is installed.
+
 """
+import math
 from random import randrange
 
+from algorithms.sorting import heap_sort, numpy_backend, utils
+
+INSERTION_SORT_THRESHOLD = 16
+
 
 def partition(seq, left, right, pivot_index):
     """
@@ -38,7 +72,74 @@ def partition(seq, left, right, pivot_index):
     return store_index
 
 
-def sort(seq, left, right):
+def three_way_partition(seq, left, right, pivot_index):
+    """
+    Reorders the slice in to values lower than the pivot, values equal to
+    it and values bigger than it (the Dutch national flag problem).
+    Returns the bounds of the equal range.
+
+    :param seq: A list of integers
+    :param left: An integer representing left index
+    :param right: An integer representing right index
+    :param pivot_index: An integer that we're pivoting off
+    :rtype: A tuple (lt, gt) where seq[lt:gt + 1] all equal the pivot
+    """
+    pivot_value = seq[pivot_index]
+    lt = left
+    gt = right
+    i = left
+    while i <= gt:
+        if seq[i] < pivot_value:
+            seq[i], seq[lt] = seq[lt], seq[i]
+            lt += 1
+            i += 1
+        elif seq[i] > pivot_value:
+            seq[i], seq[gt] = seq[gt], seq[i]
+            gt -= 1
+        else:
+            i += 1
+    return lt, gt
+
+
+def dual_pivot_partition(seq, left, right):
+    """
+    Partitions the slice around the pivots seq[left] and seq[right], which
+    are swapped first if needed so that p <= q. Afterwards values lower
+    than p are left of p, values bigger than q are right of q and the
+    remaining values lie between the two pivots.
+
+    :param seq: A list of integers
+    :param left: An integer representing left index
+    :param right: An integer representing right index
+    :rtype: A tuple of the final pivot indices
+    """
+    if seq[left] > seq[right]:
+        seq[left], seq[right] = seq[right], seq[left]
+    p, q = seq[left], seq[right]
+    lt = left + 1
+    gt = right - 1
+    i = lt
+    while i <= gt:
+        if seq[i] < p:
+            seq[i], seq[lt] = seq[lt], seq[i]
+            lt += 1
+        elif seq[i] > q:
+            while seq[gt] > q and i < gt:
+                gt -= 1
+            seq[i], seq[gt] = seq[gt], seq[i]
+            gt -= 1
+            if seq[i] < p:
+                seq[i], seq[lt] = seq[lt], seq[i]
+                lt += 1
+        i += 1
+    lt -= 1
+    gt += 1
+    seq[left], seq[lt] = seq[lt], seq[left]
+    seq[right], seq[gt] = seq[gt], seq[right]
+    return lt, gt
+
+
+def sort(seq, left, right, key=None, reverse=False):
     """
     Takes a list of integers and sorts them in ascending order. This sorted
     list is then returned.
@@ -46,14 +147,194 @@ def sort(seq, left, right):
     :param seq: A list of integers
     :param left: An integer representing the beginning index
     :param right: An integer representing the end index
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
     :rtype: A list of sorted integers
     """
+    buf = numpy_backend.as_buffer(seq) if key is None else None
+    if buf is not None:
+        numpy_backend.quick_sort(buf[left:right + 1], reverse)
+        return seq
+    if key is not None or reverse:
+        utils.assign(seq, utils.keyed_sort(
+            lambda s: sort(s, 0, len(s) - 1),
+            seq[left:right + 1], key, reverse), left, right + 1)
+        return seq
 
     if len(seq) <= 1:
         return seq
     elif left < right:
         pivot = randrange(left, right)
-        pivot_new_index = partition(seq, left, right, pivot)
-        sort(seq, left, pivot_new_index - 1)
-        sort(seq, pivot_new_index + 1, right)
+        lt, gt = three_way_partition(seq, left, right, pivot)
+        sort(seq, left, lt - 1)
+        sort(seq, gt + 1, right)
+        return seq
+
+
+def argsort(seq, key=None, reverse=False):
+    """
+    Returns the permutation of indices that sorts seq. seq is not modified.
+
+    :param seq: A list of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of indices
+    """
+    return utils.argsort(lambda s: sort(s, 0, len(s) - 1),
+                         seq, key, reverse)
+
+
+def dual_pivot_sort(seq, left=0, right=None, key=None, reverse=False):
+    """
+    Takes a list of integers and sorts seq[left:right + 1] in ascending
+    order with dual-pivot quick sort. The sorted list is then returned.
+
+    :param seq: A list of integers
+    :param left: An integer representing the beginning index
+    :param right: An integer representing the end index, defaults to the
+                  last index of the list
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of sorted integers
+    """
+    if right is None:
+        right = len(seq) - 1
+    if key is not None or reverse:
+        utils.assign(seq, utils.keyed_sort(
+            dual_pivot_sort, seq[left:right + 1], key, reverse),
+            left, right + 1)
+        return seq
+    stack = [(left, right)]
+    while stack:
+        lo, hi = stack.pop()
+        if hi - lo < INSERTION_SORT_THRESHOLD:
+            insertion_sort(seq, lo, hi)
+            continue
+        a, b = randrange(lo, hi + 1), randrange(lo, hi + 1)
+        seq[lo], seq[a] = seq[a], seq[lo]
+        seq[hi], seq[b] = seq[b], seq[hi]
+        lt, gt = dual_pivot_partition(seq, lo, hi)
+        stack.append((lo, lt - 1))
+        stack.append((gt + 1, hi))
+        # With equal pivots the middle range holds only copies of them.
+        if seq[lt] < seq[gt]:
+            stack.append((lt + 1, gt - 1))
+    return seq
+
+
+def median_of_three(seq, a, b, c):
+    """
+    Returns whichever of the indices a, b and c holds the median value.
+
+    :param seq: A list of integers
+    :param a: An integer index
+    :param b: An integer index
+    :param c: An integer index
+    :rtype: The index of the median value
+    """
+    if seq[a] < seq[b]:
+        if seq[b] < seq[c]:
+            return b
+        return c if seq[a] < seq[c] else a
+    if seq[a] < seq[c]:
+        return a
+    return c if seq[b] < seq[c] else b
+
+
+def hoare_partition(seq, left, right, pivot_index):
+    """
+    Reorders the slice so that seq[left:p + 1] holds values no bigger than
+    the pivot and seq[p + 1:right + 1] values no smaller than it, and
+    returns p. Both scans stop on values equal to the pivot, so runs of
+    equal values are split evenly instead of all landing on one side.
+
+    :param seq: A list of integers
+    :param left: An integer representing left index
+    :param right: An integer representing right index
+    :param pivot_index: An integer that we're pivoting off
+    :rtype: The integer index p, with left <= p < right
+    """
+    seq[left], seq[pivot_index] = seq[pivot_index], seq[left]
+    pivot_value = seq[left]
+    i = left - 1
+    j = right + 1
+    while True:
+        i += 1
+        while seq[i] < pivot_value:
+            i += 1
+        j -= 1
+        while seq[j] > pivot_value:
+            j -= 1
+        if i >= j:
+            return j
+        seq[i], seq[j] = seq[j], seq[i]
+
+
+def insertion_sort(seq, left, right):
+    """
+    Sorts seq[left:right + 1] in place with insertion sort.
+
+    :param seq: A list of integers
+    :param left: An integer representing the beginning index
+    :param right: An integer representing the end index
+    """
+    for n in range(left + 1, right + 1):
+        item = seq[n]
+        hole = n
+        while hole > left and seq[hole - 1] > item:
+            seq[hole] = seq[hole - 1]
+            hole -= 1
+        seq[hole] = item
+
+
+def introsort(seq, left=0, right=None, key=None, reverse=False):
+    """
+    Takes a list of integers and sorts seq[left:right + 1] in ascending
+    order without recursion. The sorted list is then returned.
+
+    :param seq: A list of integers
+    :param left: An integer representing the beginning index
+    :param right: An integer representing the end index, defaults to the
+                  last index of the list
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of sorted integers
+    """
+    if right is None:
+        right = len(seq) - 1
+    buf = numpy_backend.as_buffer(seq) if key is None else None
+    if buf is not None:
+        numpy_backend.quick_sort(buf[left:right + 1], reverse)
+        return seq
+    if key is not None or reverse:
+        utils.assign(seq, utils.keyed_sort(
+            introsort, seq[left:right + 1], key, reverse), left, right + 1)
         return seq
+    if right <= left:
+        return seq
+
+    # The larger side of each partition is pushed and the smaller side is
+    # sorted next, so the stack never holds more than log2(n) ranges.
+    stack = [(left, right, 2 * int(math.log(right - left + 1, 2)))]
+    while stack:
+        lo, hi, depth = stack.pop()
+        while hi - lo >= INSERTION_SORT_THRESHOLD:
+            if depth == 0:
+                heap_sort.sort_range(seq, lo, hi + 1, heap_sort.ARITY)
+                break
+            depth -= 1
+            pivot = median_of_three(seq, lo, lo + (hi - lo) // 2, hi)
+            p = hoare_partition(seq, lo, hi, pivot)
+            if p - lo < hi - p:
+                stack.append((p + 1, hi, depth))
+                hi = p
+            else:
+                stack.append((lo, p, depth))
+                lo = p + 1
+        else:
+            insertion_sort(seq, lo, hi)
+    return seq
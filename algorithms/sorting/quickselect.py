@@ -0,0 +1,156 @@
+"""
+    Quickselect
+    -----------
+    Finds the k-th smallest element of a list without sorting it, by
+    partitioning around a pivot and only continuing in the side that holds
+    rank k. The partitioning is the three-way partition from
+    `quick_sort_in_place`, so runs of equal values are settled in one step.
+
+    `select` is an introselect: it uses random pivots while they keep
+    halving the range and switches to the median-of-medians pivot as soon as
+    they stop doing so, which bounds the worst case to linear time.
+    `multi_select` finds many ranks in a single pass, splitting the sorted
+    ranks between the two sides of every partition.
+
+    Time Complexity: O(n) worst case for `select`, O(n log m) expected for
+                     m ranks with `multi_select`
+
+    Space Complexity: O(log n) Auxiliary
+
+    Psuedo Code: https://en.wikipedia.org/wiki/Introselect
+
+"""
+from bisect import bisect_left, bisect_right
+import math
+from random import randrange
+
+from algorithms.sorting.quick_sort_in_place import (
+    INSERTION_SORT_THRESHOLD, insertion_sort, three_way_partition)
+
+
+def median_of_medians(seq, left, right):
+    """
+    Returns the index of a pivot that is guaranteed to have at least 30% of
+    seq[left:right + 1] on either side. The range is split in to groups of
+    five, the median of every group is moved to the front, and the median of
+    those medians is selected recursively.
+
+    :param seq: A list of integers
+    :param left: An integer representing left index
+    :param right: An integer representing right index
+    :rtype: The integer index of the pivot
+    """
+    if right - left < 5:
+        insertion_sort(seq, left, right)
+        return left + (right - left) // 2
+    store = left
+    for lo in range(left, right + 1, 5):
+        hi = min(lo + 4, right)
+        insertion_sort(seq, lo, hi)
+        mid = lo + (hi - lo) // 2
+        seq[store], seq[mid] = seq[mid], seq[store]
+        store += 1
+    mid = left + (store - 1 - left) // 2
+    select(seq, mid, left, store - 1)
+    return mid
+
+
+def select(seq, k, left=0, right=None):
+    """
+    Returns the k-th smallest element (counting from 0) of seq[left:right +
+    1]. The list is rearranged in place so that seq[k] holds that element,
+    with no bigger element before it and no smaller element after it.
+
+    :param seq: A list of integers
+    :param k: An integer rank, with left <= k <= right
+    :param left: An integer representing the beginning index
+    :param right: An integer representing the end index, defaults to the
+                  last index of the list
+    :rtype: The element of rank k
+    """
+    if right is None:
+        right = len(seq) - 1
+    if not left <= k <= right:
+        raise IndexError("rank %d is out of range" % k)
+
+    checkpoint = right - left + 1
+    steps = 0
+    use_median_of_medians = False
+    while True:
+        if right - left < INSERTION_SORT_THRESHOLD:
+            insertion_sort(seq, left, right)
+            return seq[k]
+        # Random pivots must halve the range every two partitions, or the
+        # rest of the search falls back to median-of-medians.
+        if steps == 2:
+            size = right - left + 1
+            if size > checkpoint // 2:
+                use_median_of_medians = True
+            checkpoint = size
+            steps = 0
+        steps += 1
+
+        if use_median_of_medians:
+            pivot = median_of_medians(seq, left, right)
+        else:
+            pivot = randrange(left, right + 1)
+        lt, gt = three_way_partition(seq, left, right, pivot)
+        if k < lt:
+            right = lt - 1
+        elif k > gt:
+            left = gt + 1
+        else:
+            return seq[k]
+
+
+def multi_select(seq, ks):
+    """
+    Returns the elements of every rank in ks. The list is rearranged in
+    place so that seq[k] holds the element of rank k for each k in ks.
+
+    :param seq: A list of integers
+    :param ks: An iterable of integer ranks
+    :rtype: A list of elements, in the same order as ks
+    """
+    ks = list(ks)
+    ranks = sorted(set(ks))
+    n = len(seq)
+    if ranks and not (0 <= ranks[0] and ranks[-1] < n):
+        raise IndexError("ranks must be between 0 and %d" % (n - 1))
+
+    stack = [(0, n - 1, 0, len(ranks))]
+    while stack:
+        left, right, a, b = stack.pop()
+        if a == b:
+            continue
+        if b - a == 1:
+            select(seq, ranks[a], left, right)
+            continue
+        if right - left < INSERTION_SORT_THRESHOLD:
+            insertion_sort(seq, left, right)
+            continue
+        lt, gt = three_way_partition(seq, left, right,
+                                     randrange(left, right + 1))
+        # Ranks inside [lt, gt] are settled, the others go to their side.
+        i = bisect_left(ranks, lt, a, b)
+        j = bisect_right(ranks, gt, i, b)
+        stack.append((left, lt - 1, a, i))
+        stack.append((gt + 1, right, j, b))
+    return [seq[k] for k in ks]
+
+
+def percentiles(seq, ps):
+    """
+    Returns the nearest-rank percentiles of seq, e.g. ps=(50, 90, 99) for
+    the p50, p90 and p99 values, using a single `multi_select` pass. The
+    list is rearranged in place.
+
+    :param seq: A non empty list of integers
+    :param ps: An iterable of percentiles between 0 and 100
+    :rtype: A list of elements, in the same order as ps
+    """
+    n = len(seq)
+    # Nearest rank: the smallest element with at least p% of the data at or
+    # below it, i.e. rank ceil(p * n / 100) - 1.
+    return multi_select(
+        seq, [max(0, int(math.ceil(p * n / 100.0)) - 1) for p in ps])
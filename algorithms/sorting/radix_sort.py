@@ -0,0 +1,259 @@
+"""
+    Radix Sort
+    ----------
+    A non-comparison sort that distributes keys by one digit at a time.
+
+    `sort` is a least significant digit (LSD) radix sort for signed integers
+    using 8 bit digits. Keys are shifted by the minimum so that they are all
+    non-negative, and the digit histogram of each pass decides whether the
+    pass can be skipped because every key shares that digit. Keys that fit
+    in 64 bits are kept in `array.array` buffers. When NumPy is installed the
+    histogram and scatter of every pass are vectorized, and NumPy arrays and
+    numeric `array.array` objects of integers or floats are sorted in place
+    by `numpy_backend.radix_sort`.
+
+    `sort_bytes` is a most significant digit (MSD) radix sort for byte
+    strings of any length and `sort_fixed` is an LSD radix sort for keys of
+    a fixed width in bytes.
+
+    Time Complexity: O(w * n) for w digits per key
+
+    Space Complexity: O(n + 256) Auxiliary
+
+    Stable: Yes
+
+    Psuedo Code: https://en.wikipedia.org/wiki/Radix_sort
+
+"""
+from array import array
+
+from algorithms.sorting import numpy_backend, utils
+from algorithms.sorting.numpy_backend import np
+
+RADIX_BITS = 8
+RADIX = 1 << RADIX_BITS
+MASK = RADIX - 1
+INSERTION_SORT_THRESHOLD = 16
+
+
+def _word_typecode():
+    # 'Q' is missing before Python 3.3, where 'L' is the widest typecode.
+    for typecode in 'QL':
+        try:
+            if array(typecode).itemsize >= 8:
+                return typecode
+        except ValueError:
+            pass
+    return None
+
+
+WORD_TYPECODE = _word_typecode()
+
+
+def _buffer(keys, max_key):
+    if WORD_TYPECODE is not None and max_key < 1 << 64:
+        return array(WORD_TYPECODE, keys)
+    return list(keys)
+
+
+def _lsd_python(keys, values, passes):
+    n = len(keys)
+    scratch = keys[:]
+    value_scratch = values[:] if values is not None else None
+    for shift in passes:
+        counts = [0] * RADIX
+        for k in keys:
+            counts[(k >> shift) & MASK] += 1
+        if max(counts) == n:
+            continue
+        total = 0
+        for d in range(RADIX):
+            counts[d], total = total, total + counts[d]
+        if values is None:
+            for k in keys:
+                d = (k >> shift) & MASK
+                scratch[counts[d]] = k
+                counts[d] += 1
+        else:
+            for k, v in zip(keys, values):
+                d = (k >> shift) & MASK
+                scratch[counts[d]] = k
+                value_scratch[counts[d]] = v
+                counts[d] += 1
+            values, value_scratch = value_scratch, values
+        keys, scratch = scratch, keys
+    return keys, values
+
+
+def sort(seq, key=None, reverse=False, use_numpy=None):
+    """
+    Takes a list of integers and sorts them in ascending order. This sorted
+    list is then returned.
+
+    :param seq: A list of integers
+    :param key: A function of one argument that returns an integer sort key
+                for an element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :param use_numpy: A boolean, True to vectorize every pass with NumPy.
+                      Defaults to using NumPy when it is installed and the
+                      keys fit in 64 bits
+    :rtype: A list of sorted integers
+    """
+    buf = None
+    if key is None and use_numpy is not False:
+        buf = numpy_backend.as_buffer(seq)
+    if buf is not None:
+        numpy_backend.radix_sort(buf, reverse)
+        return seq
+
+    n = len(seq)
+    if n < 2:
+        return seq
+
+    keys = list(seq) if key is None else [key(x) for x in seq]
+    if reverse:
+        keys = [-k for k in keys]
+    # Sorted keys can only stand in for the elements themselves when those
+    # are plain ints; bools and other int subclasses are carried along.
+    if key is None and not reverse and all(type(k) is int for k in keys):
+        values = None
+    else:
+        values = list(seq)
+
+    lo = min(keys)
+    max_key = max(keys) - lo
+    keys = [k - lo for k in keys]
+    passes = range(0, max(max_key.bit_length(), 1), RADIX_BITS)
+
+    if use_numpy is None:
+        use_numpy = np is not None and max_key < 1 << 64
+    if use_numpy:
+        keys, perm = numpy_backend.radix_passes(
+            np.asarray(keys, dtype=np.uint64), passes, MASK)
+        if values is None:
+            utils.assign(seq, [k + lo for k in keys.tolist()])
+        else:
+            utils.assign(seq, [values[i] for i in perm])
+        return seq
+
+    keys, values = _lsd_python(_buffer(keys, max_key), values, passes)
+    if values is None:
+        utils.assign(seq, [k + lo for k in keys])
+    else:
+        utils.assign(seq, values)
+    return seq
+
+
+def argsort(seq, key=None, reverse=False):
+    """
+    Returns the permutation of indices that sorts seq. seq is not modified.
+
+    :param seq: A list of integers
+    :param key: A function of one argument that returns an integer sort key
+                for an element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of indices
+    """
+    keys = list(seq) if key is None else [key(x) for x in seq]
+    return sort(list(range(len(keys))), key=keys.__getitem__,
+                reverse=reverse)
+
+
+def sort_fixed(seq, width, key=None):
+    """
+    Takes a list of elements whose keys are byte strings of exactly `width`
+    bytes and sorts them in ascending order with one LSD pass per byte. This
+    sorted list is then returned.
+
+    :param seq: A list of elements
+    :param width: An integer width of every key in bytes
+    :param key: A function of one argument that returns the key of an
+                element, defaults to the element itself
+    :rtype: A list of sorted elements
+    """
+    n = len(seq)
+    if n < 2:
+        return seq
+    keys = [bytearray(x if key is None else key(x)) for x in seq]
+    if any(len(k) != width for k in keys):
+        raise ValueError("every key must be exactly %d bytes" % width)
+
+    order = array('L', range(n))
+    scratch = array('L', order)
+    for pos in range(width - 1, -1, -1):
+        counts = [0] * RADIX
+        for k in keys:
+            counts[k[pos]] += 1
+        if max(counts) == n:
+            continue
+        total = 0
+        for d in range(RADIX):
+            counts[d], total = total, total + counts[d]
+        for i in order:
+            d = keys[i][pos]
+            scratch[counts[d]] = i
+            counts[d] += 1
+        order, scratch = scratch, order
+    utils.assign(seq, [seq[i] for i in order])
+    return seq
+
+
+def sort_bytes(seq):
+    """
+    Takes a list of byte strings of any length and sorts them in ascending
+    lexicographic order. Buckets are processed from the most significant
+    byte with an explicit stack, and small buckets are finished with
+    insertion sort. This sorted list is then returned.
+
+    :param seq: A list of byte strings
+    :rtype: A list of sorted byte strings
+    """
+    if len(seq) < 2:
+        return seq
+    if isinstance(b'a'[0], str):
+        # Indexing a byte string gives a one byte string on Python 2, but a
+        # bytearray gives integers everywhere.
+        keys = _msd_bytes([bytearray(s) for s in seq])
+        utils.assign(seq, [bytes(k) for k in keys])
+        return seq
+    return _msd_bytes(seq)
+
+
+def _msd_bytes(seq):
+    n = len(seq)
+    aux = [None] * n
+    # Bucket 0 holds strings that end at this depth, byte b goes to b + 1.
+    stack = [(0, n, 0)]
+    while stack:
+        lo, hi, depth = stack.pop()
+        if hi - lo < INSERTION_SORT_THRESHOLD:
+            # Every string in the range shares its first `depth` bytes, so
+            # comparing whole strings gives the same order.
+            for i in range(lo + 1, hi):
+                item = seq[i]
+                j = i
+                while j > lo and seq[j - 1] > item:
+                    seq[j] = seq[j - 1]
+                    j -= 1
+                seq[j] = item
+            continue
+
+        counts = [0] * (RADIX + 2)
+        for i in range(lo, hi):
+            s = seq[i]
+            counts[(s[depth] + 2) if depth < len(s) else 1] += 1
+        for d in range(RADIX + 1):
+            counts[d + 1] += counts[d]
+        for i in range(lo, hi):
+            s = seq[i]
+            d = (s[depth] + 1) if depth < len(s) else 0
+            aux[counts[d]] = s
+            counts[d] += 1
+        seq[lo:hi] = aux[:hi - lo]
+
+        # After the scatter counts[d] is the end of bucket d.
+        for d in range(1, RADIX + 1):
+            start, end = lo + counts[d - 1], lo + counts[d]
+            if end - start > 1:
+                stack.append((start, end, depth + 1))
+    return seq
@@ -0,0 +1,155 @@
+"""
+    Record Sort
+    -----------
+    Sorts a binary file of fixed-width records in place through `mmap`.
+
+    `RecordView` presents a writable buffer as a mutable sequence of
+    (key, record) tuples: reading position i extracts the key of the i-th
+    record and copies its bytes out of the buffer, and writing position i
+    copies the record bytes of the tuple back in. Tuples compare by key
+    first, so the in-place sorts in `heap_sort` and `quick_sort_in_place`
+    can sort the view directly, and only the records that are being moved
+    are ever held as Python objects.
+
+    By default the key is the raw bytes at a fixed offset of every record,
+    which compare like big-endian unsigned integers or fixed-width strings.
+    Any other key can be decoded with a function of the record, e.g. with
+    `struct.unpack_from`.
+
+    Time Complexity: O(n log n) record reads and writes
+
+    Space Complexity: O(log n) Auxiliary, the records stay in the file
+
+    Stable: No
+
+"""
+import mmap
+import os
+
+try:
+    from collections.abc import MutableSequence
+except ImportError:
+    from collections import MutableSequence
+
+from algorithms.sorting import heap_sort, quick_sort_in_place
+
+
+class RecordView(MutableSequence):
+
+    """
+    A fixed length sequence of (key, record) tuples over a writable buffer
+    of fixed-width records.
+
+    :param buf: A writable buffer, such as an mmap or a bytearray, whose
+                length is a multiple of record_size
+    :param record_size: An integer number of bytes per record
+    :param key_offset: An integer offset of the key inside a record
+    :param key_size: An integer length of the key in bytes, defaults to the
+                     rest of the record
+    :param key: A function of the record bytes that returns its sort key,
+                used instead of key_offset and key_size
+    """
+
+    def __init__(self, buf, record_size, key_offset=0, key_size=None,
+                 key=None):
+        if record_size < 1:
+            raise ValueError("record_size must be at least 1")
+        if len(buf) % record_size:
+            raise ValueError("buffer length is not a multiple of %d"
+                             % record_size)
+        if key_size is None:
+            key_size = record_size - key_offset
+        if key_offset < 0 or key_offset + key_size > record_size:
+            raise ValueError("the key must lie inside the record")
+        try:
+            self.view = memoryview(buf)
+        except TypeError:
+            # Python 2 has no memoryview of an mmap, but slicing one
+            # already copies the bytes out.
+            self.view = buf
+        self.record_size = record_size
+        self.key_offset = key_offset
+        self.key_size = key_size
+        self.key = key
+        self.count = len(buf) // record_size
+
+    def __len__(self):
+        return self.count
+
+    def _start(self, i):
+        if i < 0:
+            i += self.count
+        if not 0 <= i < self.count:
+            raise IndexError("record index out of range")
+        return i * self.record_size
+
+    def __getitem__(self, i):
+        start = self._start(i)
+        record = self.view[start:start + self.record_size]
+        if type(record) is not bytes:
+            record = record.tobytes()
+        if self.key is not None:
+            return self.key(record), record
+        offset = self.key_offset
+        return record[offset:offset + self.key_size], record
+
+    def __setitem__(self, i, item):
+        start = self._start(i)
+        self.view[start:start + self.record_size] = item[1]
+
+    def __delitem__(self, i):
+        raise TypeError("records cannot be deleted from a RecordView")
+
+    def insert(self, i, item):
+        raise TypeError("records cannot be inserted in to a RecordView")
+
+    def release(self):
+        """
+        Releases the memoryview, so that the underlying mmap can be closed.
+        """
+        # Python 2 views have no release and hold the buffer until they
+        # are collected.
+        release = getattr(self.view, 'release', None)
+        if release is not None:
+            release()
+
+
+SORTS = {
+    'heap': heap_sort.sort,
+    'quick': quick_sort_in_place.introsort,
+}
+
+
+def sort_file(path, record_size, key_offset=0, key_size=None, key=None,
+              algorithm='quick'):
+    """
+    Sorts the fixed-width records of a binary file in place, in ascending
+    order of their keys. The file is mapped in to memory, so it is never
+    loaded as a whole and no other file is written.
+
+    :param path: The path of the file
+    :param record_size: An integer number of bytes per record
+    :param key_offset: An integer offset of the key inside a record
+    :param key_size: An integer length of the key in bytes, defaults to the
+                     rest of the record
+    :param key: A function of the record bytes that returns its sort key,
+                used instead of key_offset and key_size
+    :param algorithm: 'quick' for introsort or 'heap' for heap sort
+    :rtype: The integer number of records sorted
+    """
+    sort = SORTS[algorithm]
+    if os.path.getsize(path) == 0:
+        return 0
+    with open(path, 'r+b') as f:
+        mapped = mmap.mmap(f.fileno(), 0)
+        try:
+            records = RecordView(mapped, record_size, key_offset, key_size,
+                                 key)
+            try:
+                sort(records)
+            finally:
+                records.release()
+            mapped.flush()
+        finally:
+            mapped.close()
+    return len(records)
@@ -0,0 +1,131 @@
+"""
+    Sample Sort
+    -----------
+    A parallel sort that splits the data by value instead of by position.
+    Splitters are taken from a sorted random sample of the input, every
+    element is sent to the bucket between the two splitters around it, and
+    the buckets are sorted independently in a pool of worker processes.
+    Since every element of a bucket is smaller than every element of the
+    next one, the sorted buckets are simply concatenated: there is no final
+    merge.
+
+    Oversampling makes the buckets close to equal in size whatever the
+    distribution of the data. Heavily repeated values are handled by
+    giving every splitter its own bucket of elements equal to it; those
+    buckets are already sorted and never sent to a worker, so skewed data
+    with a few very common values still splits evenly across the workers.
+
+    Time Complexity: O((n log n) / p + n log p) expected
+
+    Space Complexity: O(n) Auxiliary
+
+    Stable: No
+
+    Psuedo Code: https://en.wikipedia.org/wiki/Samplesort
+
+"""
+from bisect import bisect_left
+from itertools import groupby
+import multiprocessing
+import random
+
+from algorithms.sorting import quick_sort_in_place, utils
+
+OVERSAMPLE = 32
+MIN_PARALLEL_SIZE = 10000
+
+
+def choose_splitters(seq, buckets, oversample=OVERSAMPLE):
+    """
+    Picks splitters from a sorted random sample of oversample * buckets
+    elements of seq. Values that fill at least a bucket's share of the
+    sample all become splitters, so that their copies land in buckets of
+    their own, and the rest of the sample is cut in to buckets equal parts.
+
+    :param seq: A list of comparable elements
+    :param buckets: An integer number of buckets to split in to
+    :param oversample: An integer number of sampled elements per bucket
+    :rtype: A sorted list of distinct splitters
+    """
+    size = min(len(seq), oversample * buckets)
+    sample = quick_sort_in_place.introsort(random.sample(seq, size))
+    heavy = []
+    light = []
+    for x, group in groupby(sample):
+        count = len(list(group))
+        if count * buckets >= size:
+            heavy.append(x)
+        else:
+            light += [x] * count
+    cuts = [light[i * len(light) // buckets] for i in range(1, buckets)
+            if light]
+
+    splitters = []
+    for x in quick_sort_in_place.introsort(heavy + cuts):
+        if not splitters or splitters[-1] < x:
+            splitters.append(x)
+    return splitters
+
+
+def partition(seq, splitters):
+    """
+    Distributes seq in to 2 * len(splitters) + 1 buckets. Bucket 2 * b
+    holds the elements between splitters b - 1 and b, and bucket 2 * b + 1
+    the elements equal to splitter b.
+
+    :param seq: A list of comparable elements
+    :param splitters: A sorted list of distinct splitters
+    :rtype: A list of buckets, in ascending order of their values
+    """
+    k = len(splitters)
+    buckets = [[] for _ in range(2 * k + 1)]
+    for x in seq:
+        b = bisect_left(splitters, x)
+        if b < k and not x < splitters[b]:
+            buckets[2 * b + 1].append(x)
+        else:
+            buckets[2 * b].append(x)
+    return buckets
+
+
+def _sort_bucket(bucket):
+    return quick_sort_in_place.introsort(bucket)
+
+
+def sort(seq, processes=None, key=None, reverse=False):
+    """
+    Takes a list and sorts it in ascending order using a pool of worker
+    processes. A new sorted list is returned. Small lists, or a single
+    process, are sorted in this process instead.
+
+    :param seq: A list of comparable, picklable elements
+    :param processes: The number of worker processes, defaults to the number
+                      of CPUs
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of sorted elements
+    """
+    if key is not None or reverse:
+        return utils.keyed_sort(lambda s: sort(s, processes), seq, key,
+                                reverse)
+    if processes is None:
+        processes = multiprocessing.cpu_count()
+    seq = list(seq)
+    if processes < 2 or len(seq) < MIN_PARALLEL_SIZE:
+        return quick_sort_in_place.introsort(seq)
+
+    buckets = partition(seq, choose_splitters(seq, processes))
+    # Buckets of equal elements are already sorted.
+    pool = multiprocessing.Pool(processes)
+    try:
+        sorted_buckets = pool.map(_sort_bucket, buckets[::2], chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+    buckets[::2] = sorted_buckets
+
+    result = []
+    for bucket in buckets:
+        result += bucket
+    return result
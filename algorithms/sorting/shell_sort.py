@@ -1,29 +1,150 @@
 """
     Shell Sort
     ----------
-    Comparision sort that sorts far away elements first to sort the list
+    Comparision sort that sorts far away elements first to sort the list.
+    Each pass is an insertion sort over elements `gap` apart, and the gap
+    shrinks until the final pass with a gap of 1. The gap sequence decides
+    both the number of passes and the running time; Ciura's sequence is used
+    by default.
 
-    Time Complexity:  O(n**2)
+    Time Complexity:  O(n**(4/3)) with Sedgewick gaps, O(n log**2 n) with
+                      Pratt gaps
 
     Space Complexity: O(1) Auxiliary
 
-    Stable: Yes
+    Stable: No
 
     Psuedo Code: http://en.wikipedia.org/wiki/Shell_sort
 
 """
+from algorithms.sorting import utils
 
+CIURA_GAPS = [1, 4, 10, 23, 57, 132, 301, 701, 1750]
 
-def sort(seq):
+
+def shell(n):
+    """
+    Shell's original sequence n/2, n/4, ..., 1.
+
+    :param n: An integer length of the list
+    :rtype: A list of gaps in descending order
+    """
+    gaps = []
+    gap = n // 2
+    while gap > 0:
+        gaps.append(gap)
+        gap //= 2
+    return gaps or [1]
+
+
+def ciura(n):
+    """
+    Ciura's empirically found sequence 1, 4, 10, 23, 57, 132, 301, 701,
+    1750, extended past 1750 by repeatedly multiplying by 2.25.
+
+    :param n: An integer length of the list
+    :rtype: A list of gaps in descending order
+    """
+    gaps = list(CIURA_GAPS)
+    while gaps[-1] < n:
+        gaps.append(int(gaps[-1] * 2.25))
+    return [gap for gap in reversed(gaps) if gap < n] or [1]
+
+
+def tokuda(n):
+    """
+    Tokuda's sequence ceil((9 * (9/4)**k - 4) / 5): 1, 4, 9, 20, 46, 103,
+    ...
+
+    :param n: An integer length of the list
+    :rtype: A list of gaps in descending order
+    """
+    gaps = []
+    k = 0
+    while True:
+        # Integer form of ceil((9**(k + 1) / 4**k - 4) / 5).
+        num = 9 ** (k + 1) - 4 ** (k + 1)
+        gap = -(-num // (5 * 4 ** k))
+        if gap >= n and gaps:
+            break
+        gaps.append(gap)
+        k += 1
+    return gaps[::-1]
+
+
+def sedgewick(n):
+    """
+    Sedgewick's 1986 sequence 4**k + 3 * 2**(k - 1) + 1, prefixed with 1:
+    1, 8, 23, 77, 281, ...
+
+    :param n: An integer length of the list
+    :rtype: A list of gaps in descending order
+    """
+    gaps = [1]
+    k = 1
+    while True:
+        gap = 4 ** k + 3 * 2 ** (k - 1) + 1
+        if gap >= n:
+            break
+        gaps.append(gap)
+        k += 1
+    return gaps[::-1]
+
+
+def pratt(n):
+    """
+    Pratt's sequence of 3-smooth numbers 2**p * 3**q: 1, 2, 3, 4, 6, 8, 9,
+    12, ... It needs many passes but each one does very little work.
+
+    :param n: An integer length of the list
+    :rtype: A list of gaps in descending order
+    """
+    gaps = []
+    pow3 = 1
+    while pow3 < n or not gaps:
+        gap = pow3
+        while gap < n or not gaps:
+            gaps.append(gap)
+            gap *= 2
+        pow3 *= 3
+    return sorted(gaps, reverse=True)
+
+
+GAP_SEQUENCES = {
+    'shell': shell,
+    'ciura': ciura,
+    'tokuda': tokuda,
+    'sedgewick': sedgewick,
+    'pratt': pratt,
+}
+
+
+def sort(seq, key=None, reverse=False, gaps='ciura'):
     """
     Takes a list of integers and sorts them in ascending order. This sorted
     list is then returned.
 
     :param seq: A list of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :param gaps: The name of a sequence in `GAP_SEQUENCES`, a function that
+                 takes the length of the list and returns the gaps, or a
+                 list of gaps in descending order ending with 1
     :rtype: A list of sorted integers
     """
+    if key is not None or reverse:
+        seq[:] = utils.keyed_sort(lambda s: sort(s, gaps=gaps),
+                                  seq, key, reverse)
+        return seq
 
-    gaps = [x for x in range(len(seq) // 2, 0, -1)]
+    if isinstance(gaps, str):
+        gaps = GAP_SEQUENCES[gaps]
+    if callable(gaps):
+        gaps = gaps(len(seq))
+    gaps = list(gaps)
+    if gaps[-1:] != [1]:
+        raise ValueError("the last gap must be 1")
 
     for gap in gaps:
         for i in range(gap, len(seq)):
@@ -35,3 +156,16 @@ def sort(seq):
             seq[j] = temp
 
     return seq
+
+
+def argsort(seq, key=None, reverse=False):
+    """
+    Returns the permutation of indices that sorts seq. seq is not modified.
+
+    :param seq: A list of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of indices
+    """
+    return utils.argsort(sort, seq, key, reverse)
@@ -0,0 +1,180 @@
+"""
+    Smoothsort
+    ----------
+    A heap sort that is adaptive: the list is built in to a forest of
+    Leonardo heaps, max-heaps whose sizes are Leonardo numbers 1, 1, 3, 5,
+    9, 15, ... with the roots at the right end of each heap and ascending
+    from left to right. On sorted input every new element already belongs
+    at the root and no sifting happens, so the running time degrades
+    smoothly from O(n) for presorted data to O(n log n) for random data.
+
+    The shape of the forest is kept in two integers, a bit vector of the
+    heap orders present and the order of the smallest heap, so no memory
+    beyond a few variables is needed.
+
+    Time Complexity: O(n log n) worst case, O(n) on sorted input
+
+    Space Complexity: O(1) Auxiliary
+
+    Stable: No
+
+    Psuedo Code: Dijkstra, E. W. Smoothsort, an alternative for sorting in
+                 situ. EWD796a, 1981.
+
+"""
+from algorithms.sorting import utils
+
+
+def leonardo(n):
+    """
+    Returns the Leonardo numbers up to the first one bigger than n.
+
+    :param n: An integer bound
+    :rtype: A list of Leonardo numbers
+    """
+    numbers = [1, 1]
+    while numbers[-1] <= n:
+        numbers.append(numbers[-1] + numbers[-2] + 1)
+    return numbers
+
+
+def _trailing_zeros(x):
+    return (x & -x).bit_length() - 1
+
+
+def sift(seq, order, head, lp):
+    """
+    Restores the max-heap property of the Leonardo heap of the given order
+    whose root is at head, assuming both of its subheaps are heaps.
+
+    :param seq: A list of integers
+    :param order: An integer order of the heap
+    :param head: An integer index of the root of the heap
+    :param lp: A list of Leonardo numbers
+    """
+    item = seq[head]
+    while order > 1:
+        right = head - 1
+        left = right - lp[order - 2]
+        if not (item < seq[left] or item < seq[right]):
+            break
+        if not seq[left] < seq[right]:
+            seq[head] = seq[left]
+            head = left
+            order -= 1
+        else:
+            seq[head] = seq[right]
+            head = right
+            order -= 2
+    seq[head] = item
+
+
+def trinkle(seq, p, order, head, trusty, lp):
+    """
+    Moves the root at head left along the roots of the forest until the
+    roots are ascending again, then sifts it in to the heap it lands in.
+
+    :param seq: A list of integers
+    :param p: An integer bit vector of the heap orders in the forest,
+              shifted so that bit 0 is the heap at head
+    :param order: An integer order of the heap at head
+    :param head: An integer index of the root of the rightmost heap
+    :param trusty: A boolean, True if the heap at head is known to be a
+                   heap already
+    :param lp: A list of Leonardo numbers
+    """
+    item = seq[head]
+    while p != 1:
+        stepson = head - lp[order]
+        if not item < seq[stepson]:
+            break
+        if not trusty and order > 1:
+            right = head - 1
+            left = right - lp[order - 2]
+            if not (seq[right] < seq[stepson] and seq[left] < seq[stepson]):
+                break
+        seq[head] = seq[stepson]
+        head = stepson
+        trail = _trailing_zeros(p & ~1)
+        p >>= trail
+        order += trail
+        trusty = False
+    if not trusty:
+        seq[head] = item
+        sift(seq, order, head, lp)
+
+
+def sort(seq, key=None, reverse=False):
+    """
+    Takes a list of integers and sorts them in ascending order. This sorted
+    list is then returned.
+
+    :param seq: A list of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of sorted integers
+    """
+    if key is not None or reverse:
+        seq[:] = utils.keyed_sort(sort, seq, key, reverse)
+        return seq
+    n = len(seq)
+    if n < 2:
+        return seq
+    lp = leonardo(n)
+
+    # Build the forest one element at a time. Bit i of p is set if the
+    # forest holds a heap of order `order + i`.
+    last = n - 1
+    p = 1
+    order = 1
+    head = 0
+    while head < last:
+        if p & 3 == 3:
+            # Two heaps of adjacent orders merge with the new root.
+            sift(seq, order, head, lp)
+            p >>= 2
+            order += 2
+        else:
+            # The root only needs to join the sorted roots if its heap will
+            # not be merged again before the end of the list.
+            if lp[order - 1] >= last - head:
+                trinkle(seq, p, order, head, False, lp)
+            else:
+                sift(seq, order, head, lp)
+            if order == 1:
+                p <<= 1
+                order = 0
+            else:
+                p <<= order - 1
+                order = 1
+        p |= 1
+        head += 1
+    trinkle(seq, p, order, head, False, lp)
+
+    # Take the forest apart; the largest root is always rightmost.
+    while order != 1 or p != 1:
+        if order <= 1:
+            trail = _trailing_zeros(p & ~1)
+            p >>= trail
+            order += trail
+        else:
+            p = (p << 2) ^ 7
+            order -= 2
+            trinkle(seq, p >> 1, order + 1, head - lp[order] - 1, True, lp)
+            trinkle(seq, p, order, head - 1, True, lp)
+        head -= 1
+    return seq
+
+
+def argsort(seq, key=None, reverse=False):
+    """
+    Returns the permutation of indices that sorts seq. seq is not modified.
+
+    :param seq: A list of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of indices
+    """
+    return utils.argsort(sort, seq, key, reverse)
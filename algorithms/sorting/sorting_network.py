@@ -0,0 +1,118 @@
+"""
+    Sorting Network
+    ---------------
+    Sorts many short rows at once. A sorting network is a fixed sequence of
+    compare-exchange steps that sorts any input of a given length, so the
+    same steps can be applied to every row of a 2-D NumPy array together:
+    each layer of independent comparators becomes one vectorized minimum
+    and maximum over whole columns, and the cost of a Python call is paid
+    per layer instead of per row.
+
+    `network` builds Batcher's odd-even merge sort network for any length,
+    grouped in to layers. Rows longer than `MAX_NETWORK_SIZE`, and rows of
+    plain lists, are sorted one at a time by a per-row kernel instead.
+
+    Time Complexity: O(m n log**2 n) comparisons for m rows of length n,
+                     in O(log**2 n) vectorized layers
+
+    Space Complexity: O(m n) Auxiliary
+
+    Stable: No
+
+    Psuedo Code: Knuth, D. The Art of Computer Programming, Vol. 3,
+                 5.3.4 Networks for Sorting. Algorithm M.
+
+"""
+from algorithms.sorting import numpy_backend
+from algorithms.sorting.numpy_backend import np
+
+MAX_NETWORK_SIZE = 1024
+
+_networks = {}
+
+
+def network(n):
+    """
+    Returns Batcher's odd-even merge sort network for n inputs as a list of
+    layers. Every layer is a pair of equally long lists (lo, hi) such that
+    the comparators (lo[c], hi[c]) of the layer touch distinct positions
+    and each one puts the smaller element at lo[c].
+
+    :param n: An integer number of inputs
+    :rtype: A list of (lo, hi) tuples of index lists
+    """
+    if n not in _networks:
+        layers = []
+        p = 1
+        while p < n:
+            k = p
+            while k >= 1:
+                lo, hi = [], []
+                for j in range(k % p, n - k, 2 * k):
+                    for i in range(min(k, n - j - k)):
+                        if (i + j) // (2 * p) == (i + j + k) // (2 * p):
+                            lo.append(i + j)
+                            hi.append(i + j + k)
+                if lo:
+                    layers.append((lo, hi))
+                k //= 2
+            p *= 2
+        _networks[n] = layers
+    return _networks[n]
+
+
+def sort_row(row):
+    """
+    Sorts one row in place with insertion sort, the per-row kernel used
+    where no network is applied.
+
+    :param row: A list of comparable elements
+    :rtype: The sorted list
+    """
+    for i in range(1, len(row)):
+        item = row[i]
+        j = i
+        while j > 0 and row[j - 1] > item:
+            row[j] = row[j - 1]
+            j -= 1
+        row[j] = item
+    return row
+
+
+def sort_rows(rows):
+    """
+    Sorts every row of rows in place in ascending order. This sorted batch
+    is then returned.
+
+    A 2-D NumPy array with rows of up to `MAX_NETWORK_SIZE` elements is
+    sorted by a vectorized sorting network over all rows at once. Longer
+    NumPy rows are sorted one at a time with `numpy_backend.merge_sort`,
+    and a list of lists one row at a time with `sort_row`.
+
+    :param rows: A 2-D NumPy array or a list of lists
+    :rtype: The batch of sorted rows
+    """
+    if np is None or not isinstance(rows, np.ndarray):
+        for row in rows:
+            sort_row(row)
+        return rows
+    if rows.ndim != 2:
+        raise ValueError("rows must be a 2-D array")
+
+    width = rows.shape[1]
+    if width > MAX_NETWORK_SIZE:
+        for row in rows:
+            numpy_backend.merge_sort(row)
+        return rows
+
+    # Columns of the transposed copy are contiguous, so every layer reads
+    # and writes whole blocks of memory.
+    columns = np.ascontiguousarray(rows.T)
+    for lo, hi in network(width):
+        a = columns[lo]
+        b = columns[hi]
+        numpy_backend.compare_exchange(a, b)
+        columns[lo] = a
+        columns[hi] = b
+    rows[...] = columns.T
+    return rows
@@ -16,9 +16,22 @@
 
     Psuedo Code: https://en.wikipedia.org/wiki/Strand_sort
 """
+from algorithms.sorting import utils
 
 
-def sort(array):
+def sort(array, key=None, reverse=False):
+    """
+    Takes a list of integers and returns a new list with them sorted in
+    ascending order. The input list is consumed.
+
+    :param array: A list of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of sorted integers
+    """
+    if key is not None or reverse:
+        return utils.keyed_sort(sort, array, key, reverse)
     if len(array) < 2:
         return array
     result = []
@@ -41,6 +54,19 @@ def sort(array):
     return result
 
 
+def argsort(seq, key=None, reverse=False):
+    """
+    Returns the permutation of indices that sorts seq. seq is not modified.
+
+    :param seq: A list of integers
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of indices
+    """
+    return utils.argsort(sort, seq, key, reverse)
+
+
 def merge(left, right):
     if not left:
         return right
@@ -0,0 +1,175 @@
+"""
+    Sorting Utilities
+    -----------------
+    Helpers shared by the sorting algorithms.
+
+    `key=` and `reverse=` are implemented with the decorate-sort-undecorate
+    idiom: every element is wrapped once in a (key, index, element) tuple,
+    the tuples are sorted by the plain algorithm and the elements are then
+    unwrapped. The key function is therefore called exactly once per
+    element, and comparisons between tuples run at C speed. Because the
+    original index breaks ties between equal keys, the element itself is
+    never compared and equal keys keep their input order.
+
+    `argsort` sorts (key, index) pairs in the same way and returns only the
+    indices, and `apply_permutation` uses that result to reorder any number
+    of parallel columns in place.
+
+    `assign` writes sorted elements back in to a list or an `array.array`.
+
+"""
+from array import array
+
+
+def decorate(seq, key=None, reverse=False):
+    """
+    Wraps every element of seq in a (key, index, element) tuple. For a
+    reverse sort the index is negated, so that after the ascending sort is
+    reversed, elements with equal keys are still in their input order.
+
+    :param seq: An iterable of elements
+    :param key: A function of one argument that returns the sort key of an
+                element, defaults to the element itself
+    :param reverse: A boolean, True if the sort will be reversed
+    :rtype: A list of tuples
+    """
+    sign = -1 if reverse else 1
+    if key is None:
+        return [(x, sign * i, x) for i, x in enumerate(seq)]
+    return [(key(x), sign * i, x) for i, x in enumerate(seq)]
+
+
+def undecorate(decorated, reverse=False):
+    """
+    Unwraps a sorted list of tuples built by `decorate`.
+
+    :param decorated: A list of (key, index, element) tuples
+    :param reverse: A boolean, True to return the elements in reverse order
+    :rtype: A list of elements
+    """
+    result = [x for _, _, x in decorated]
+    if reverse:
+        result.reverse()
+    return result
+
+
+def keyed_sort(sort, seq, key=None, reverse=False):
+    """
+    Sorts seq with the given sorting function, calling `key` once per
+    element. A new list is returned and seq is left untouched.
+
+    :param sort: A function that sorts a list in ascending order and
+                 returns it
+    :param seq: An iterable of elements
+    :param key: A function of one argument that returns the sort key of an
+                element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of sorted elements
+    """
+    return undecorate(sort(decorate(seq, key, reverse)), reverse)
+
+
+def assign(seq, items, lo=0, hi=None):
+    """
+    Replaces seq[lo:hi] with items. An `array.array` only accepts another
+    array of the same typecode in a slice assignment, so for one the items
+    are converted first.
+
+    :param seq: A list, `array.array` or other mutable sequence
+    :param items: An iterable of hi - lo elements
+    :param lo: An integer start of the slice
+    :param hi: An integer end of the slice, defaults to len(seq)
+    """
+    if hi is None:
+        hi = len(seq)
+    if isinstance(seq, array):
+        items = array(seq.typecode, items)
+    seq[lo:hi] = items
+
+
+class ReverseKey(object):
+
+    """
+    Wraps a key so that it compares in reverse order. Used where the output
+    is streamed and cannot simply be reversed at the end.
+    """
+
+    __slots__ = ('key',)
+
+    def __init__(self, key):
+        self.key = key
+
+    def __eq__(self, other):
+        return self.key == other.key
+
+    def __ne__(self, other):
+        return self.key != other.key
+
+    def __lt__(self, other):
+        return other.key < self.key
+
+    def __le__(self, other):
+        return other.key <= self.key
+
+    def __gt__(self, other):
+        return other.key > self.key
+
+    def __ge__(self, other):
+        return other.key >= self.key
+
+
+def argsort(sort, seq, key=None, reverse=False):
+    """
+    Returns the permutation that sorts seq with the given sorting function,
+    so that [seq[i] for i in argsort(sort, seq)] is in sorted order. Only
+    (key, index) pairs are sorted and seq is left untouched. Equal keys keep
+    their input order.
+
+    :param sort: A function that sorts a list in ascending order and
+                 returns it
+    :param seq: A sequence of elements
+    :param key: A function of one argument that returns the sort key of an
+                element, it is called exactly once per element
+    :param reverse: A boolean, True to sort in descending order
+    :rtype: A list of indices
+    """
+    sign = -1 if reverse else 1
+    keys = seq if key is None else map(key, seq)
+    perm = [sign * i for _, i in
+            sort([(k, sign * i) for i, k in enumerate(keys)])]
+    if reverse:
+        perm.reverse()
+    return perm
+
+
+def apply_permutation(perm, *columns):
+    """
+    Reorders every column in place so that column[i] becomes the old
+    column[perm[i]]. The permutation is applied by following its cycles, so
+    each column is rearranged with one saved element per cycle and a
+    bytearray of visited flags, instead of building new lists or zipping
+    the columns in to rows.
+
+    :param perm: A list of indices, such as the result of `argsort`
+    :param columns: Mutable sequences of the same length as perm
+    """
+    n = len(perm)
+    if any(len(column) != n for column in columns):
+        raise ValueError("every column must have the same length as perm")
+    done = bytearray(n)
+    for start in range(n):
+        if done[start]:
+            continue
+        done[start] = 1
+        j = perm[start]
+        if j == start:
+            continue
+        saved = [column[start] for column in columns]
+        i = start
+        while j != start:
+            for column in columns:
+                column[i] = column[j]
+            done[j] = 1
+            i, j = j, perm[j]
+        for column, value in zip(columns, saved):
+            column[i] = value
@@ -1,20 +1,50 @@
+from array import array
+import itertools
+import os
 import random
+import struct
+import tempfile
 import unittest
 
+try:
+    from collections.abc import MutableSequence
+except ImportError:
+    from collections import MutableSequence
+
+import algorithms.sorting
 from algorithms.sorting import (
+    auto_sort,
     bogo_sort,
     bubble_sort,
+    bucket_sort,
     cocktail_sort,
     comb_sort,
+    cycle_sort,
+    external_merge_sort,
     gnome_sort,
     heap_sort,
+    in_place_merge_sort,
+    incremental_quick_sort,
     insertion_sort,
+    kway_merge,
     merge_sort,
+    multikey_quick_sort,
+    natural_merge_sort,
+    numpy_backend,
+    parallel_merge_sort,
+    partial_sort,
     quick_sort,
     quick_sort_in_place,
+    quickselect,
+    radix_sort,
+    record_sort,
+    sample_sort,
     selection_sort,
     shell_sort,
+    smooth_sort,
+    sorting_network,
     strand_sort,
+    utils,
 )
 
 
@@ -30,6 +60,71 @@ class SortingAlgorithmTestCase(unittest.TestCase):
         self.correct = list(range(10))
 
 
+class TestAutoSort(SortingAlgorithmTestCase):
+
+    """
+    Tests the automatic sort and the algorithm it picks for each input
+    """
+
+    def test_autosort(self):
+        self.output = algorithms.sorting.sort(self.input)
+        self.assertEqual(self.correct, self.output)
+        self.assertIs(self.input, self.output)
+
+    def test_choices(self):
+        random.seed(0)
+        cases = [
+            (list(range(10)), 'insertion_sort'),
+            (list(range(5000)), 'natural_merge_sort'),
+            (list(range(5000, 0, -1)), 'natural_merge_sort'),
+            (random.sample(range(10 ** 6), 5000), 'radix_sort'),
+            ([random.randrange(10) * 0.5 for _ in range(5000)],
+             'three_way_quick_sort'),
+            ([random.random() for _ in range(5000)], 'introsort'),
+            ([str(random.random()) for _ in range(5000)], 'introsort'),
+        ]
+        for seq, algorithm in cases:
+            decision = auto_sort.choose(seq)
+            self.assertEqual(algorithm, decision.algorithm)
+            self.assertEqual(len(seq), decision.size)
+            correct = sorted(seq)
+            self.assertEqual(correct, auto_sort.dispatch(seq, decision))
+
+    def test_integers_are_checked_past_the_sample(self):
+        seq = list(range(5000))
+        random.shuffle(seq)
+        seq[random.randrange(5000)] = 0.5
+        decision = auto_sort.choose(seq, sample_size=16)
+        self.assertFalse(decision.integers)
+        self.assertEqual(sorted(seq), auto_sort.sort(seq))
+
+    def test_int_subclasses(self):
+        seq = [Status(random.randrange(1000)) for _ in range(2000)]
+        self.assertNotEqual('radix_sort', auto_sort.choose(seq).algorithm)
+        self.assertEqual(sorted(seq), algorithms.sorting.sort(seq))
+        self.assertTrue(all(type(x) is Status for x in seq))
+
+    def test_nan(self):
+        seq = [random.random() for _ in range(2000)] + [float('nan')]
+        random.shuffle(seq)
+        self.assertEqual('natural_merge_sort',
+                         auto_sort.choose(seq).algorithm)
+        self.assertEqual(len(seq), len(auto_sort.sort(seq)))
+        np = numpy_backend.np
+        if np is not None:
+            seq = np.array(seq)
+            self.assertEqual('radix_sort', auto_sort.choose(seq).algorithm)
+            auto_sort.sort(seq)
+            self.assertTrue(np.isnan(seq[-1]))
+            self.assertEqual(sorted(seq[:-1].tolist()), seq[:-1].tolist())
+
+    def test_key_reverse(self):
+        seq = [(random.randrange(5), i) for i in range(100)]
+        correct = sorted(seq, key=lambda x: x[0], reverse=True)
+        self.assertEqual(correct, auto_sort.sort(
+            seq, key=lambda x: x[0], reverse=True))
+
+
 class TestBogoSort(SortingAlgorithmTestCase):
 
     """
@@ -52,6 +147,73 @@ class TestBubbleSort(SortingAlgorithmTestCase):
         self.assertEqual(self.correct, self.output)
 
 
+class TestBucketSort(SortingAlgorithmTestCase):
+
+    """
+    Tests Bucket sort on a small range from 0-9, on uniform and skewed
+    floats, on repeated keys and on the NumPy path
+    """
+
+    def test_bucketsort(self):
+        self.output = bucket_sort.sort(self.input)
+        self.assertEqual(self.correct, self.output)
+
+    def test_bucketsort_floats(self):
+        for power in (1, 8):
+            self.seq = [random.random() ** power for _ in range(2000)]
+            self.output = bucket_sort.sort(list(self.seq))
+            self.assertEqual(sorted(self.seq), self.output)
+
+    def test_bucketsort_repeated(self):
+        self.seq = [random.choice([0.25, 0.5, 0.75]) for _ in range(500)]
+        self.output = bucket_sort.sort(list(self.seq))
+        self.assertEqual(sorted(self.seq), self.output)
+        self.output = bucket_sort.sort([0.5] * 100)
+        self.assertEqual([0.5] * 100, self.output)
+
+    def test_bucketsort_stable(self):
+        self.output = bucket_sort.sort([1, 1.0] * 40 + [0.5] * 10)
+        self.assertEqual([0.5] * 10 + [1, 1.0] * 40, self.output)
+        self.assertEqual([float] * 10 + [int, float] * 40,
+                         [type(x) for x in self.output])
+
+    def test_bucketsort_not_finite(self):
+        inf = float('inf')
+        for self.seq in ([inf, 0.5, 0.2], [-inf, 0.5, inf] * 20,
+                         [inf] * 40, [10 ** 400, 1, 2], [5e-324, 0.0] * 20):
+            self.output = bucket_sort.sort(list(self.seq))
+            self.assertEqual(sorted(self.seq), self.output)
+            if bucket_sort.np is not None and 10 ** 400 not in self.seq:
+                seq = bucket_sort.np.array(self.seq)
+                bucket_sort.sort(seq)
+                self.assertEqual(sorted(self.seq), seq.tolist())
+        nan = float('nan')
+        for self.seq in ([0.5, nan, 0.2], [nan, 1.0, 0.5] * 20):
+            numbers = sorted(x for x in self.seq if x == x)
+            self.output = bucket_sort.sort(list(self.seq))
+            self.assertEqual(numbers, sorted(x for x in self.output if x == x))
+            self.assertEqual(len(self.seq), len(self.output))
+            if bucket_sort.np is not None:
+                seq = bucket_sort.np.array(self.seq)
+                bucket_sort.sort(seq)
+                self.assertEqual(numbers, seq[:len(numbers)].tolist())
+
+    @unittest.skipIf(bucket_sort.np is None, "NumPy is not installed")
+    def test_bucketsort_numpy(self):
+        np = bucket_sort.np
+        for seq in (np.random.random(5000), np.random.random(5000) ** 8,
+                    np.random.randint(-128, 128, 1000).astype(np.int8)):
+            self.correct = sorted(seq.tolist())
+            self.assertIs(seq, bucket_sort.sort(seq))
+            self.assertEqual(self.correct, seq.tolist())
+            bucket_sort.sort(seq, reverse=True)
+            self.assertEqual(self.correct[::-1], seq.tolist())
+
+    def test_histogram(self):
+        self.output = bucket_sort.histogram([0.1, 0.2, 0.9], 0.0, 1.0, 2)
+        self.assertEqual([0.0, 0.6, 1.0], self.output)
+
+
 class TestCocktailSort(SortingAlgorithmTestCase):
 
     """
@@ -74,6 +236,112 @@ class TestCombSort(SortingAlgorithmTestCase):
         self.assertEqual(self.correct, self.output)
 
 
+class WriteCountingList(MutableSequence):
+
+    """
+    A fixed length list that counts how often its items are assigned.
+    """
+
+    def __init__(self, items):
+        self.items = list(items)
+        self.writes = 0
+
+    def __len__(self):
+        return len(self.items)
+
+    def __getitem__(self, i):
+        return self.items[i]
+
+    def __setitem__(self, i, value):
+        self.writes += 1
+        self.items[i] = value
+
+    def __delitem__(self, i):
+        raise TypeError
+
+    def insert(self, i, value):
+        raise TypeError
+
+
+class TestCycleSort(SortingAlgorithmTestCase):
+
+    """
+    Tests Cycle sort on a small range from 0-9 and checks that it writes
+    exactly once per element that is out of place
+    """
+
+    def test_cyclesort(self):
+        self.output = cycle_sort.sort(self.input)
+        self.assertEqual(self.correct, self.output)
+
+    def test_minimum_writes(self):
+        self.seq = [random.randint(0, 5) for _ in range(200)]
+        for reverse in (False, True):
+            correct = sorted(self.seq, reverse=reverse)
+            moved = sum(1 for a, b in zip(self.seq, correct) if a != b)
+            proxy = WriteCountingList(self.seq)
+            writes = cycle_sort.sort_counting_writes(proxy, reverse=reverse)
+            self.assertEqual(correct, proxy.items)
+            self.assertEqual(moved, writes)
+            self.assertEqual(moved, proxy.writes)
+
+    def test_argsort(self):
+        self.keys = [random.randint(0, 3) for _ in range(30)]
+        for reverse in (False, True):
+            self.output = cycle_sort.argsort(self.keys, reverse=reverse)
+            self.assertEqual(
+                sorted(range(len(self.keys)), key=self.keys.__getitem__,
+                       reverse=reverse),
+                self.output)
+
+    def test_duplicates_stay(self):
+        self.seq = [1, 1, 0]
+        self.assertEqual(2, cycle_sort.sort_counting_writes(self.seq))
+        self.assertEqual([0, 1, 1], self.seq)
+        self.assertEqual(0, cycle_sort.sort_counting_writes(self.seq))
+
+    def test_record_view(self):
+        buf = bytearray(b''.join(struct.pack('>H', x) for x in self.input))
+        records = record_sort.RecordView(buf, 2)
+        self.assertEqual(sum(1 for i, x in enumerate(self.input) if i != x),
+                         cycle_sort.sort_counting_writes(records))
+        self.assertEqual(b''.join(struct.pack('>H', x) for x in self.correct),
+                         bytes(buf))
+
+
+class TestExternalMergeSort(SortingAlgorithmTestCase):
+
+    """
+    Tests External merge sort with runs spilled to temporary files
+    """
+
+    def test_external_mergesort(self):
+        self.output = list(external_merge_sort.sort(self.input, 3))
+        self.assertEqual(self.correct, self.output)
+
+    def test_external_mergesort_in_memory(self):
+        self.output = list(external_merge_sort.sort(iter(self.input)))
+        self.assertEqual(self.correct, self.output)
+
+    def test_external_mergesort_stable(self):
+        self.seq = [1, 0, 1.0, 0.0, 1]
+        self.output = list(external_merge_sort.sort(self.seq, 2))
+        self.assertEqual([int, float, int, float, int],
+                         [type(x) for x in self.output])
+
+    def test_external_mergesort_fan_in(self):
+        self.seq = [random.randint(0, 20) * 1.0 if i % 2 else
+                    random.randint(0, 20) for i in range(200)]
+        for fan_in in (2, 3, 16):
+            self.output = list(external_merge_sort.sort(
+                self.seq, 2, fan_in=fan_in))
+            self.assertEqual(sorted(self.seq), self.output)
+            self.assertEqual([type(x) for x in sorted(self.seq)],
+                             [type(x) for x in self.output])
+        self.assertRaises(ValueError, list,
+                          external_merge_sort.sort(self.seq, 2, fan_in=1))
+
+
 class TestGnomeSort(SortingAlgorithmTestCase):
 
     """
@@ -95,6 +363,107 @@ class TestHeapSort(SortingAlgorithmTestCase):
         self.output = heap_sort.sort(self.input)
         self.assertEqual(self.correct, self.output)
 
+    def test_heapsort_arity(self):
+        self.seq = [random.randint(0, 100) for _ in range(300)]
+        for arity in (2, 3, 4, 8):
+            self.output = heap_sort.sort(list(self.seq), arity=arity)
+            self.assertEqual(sorted(self.seq), self.output)
+
+    def test_heapsort_array(self):
+        self.seq = array('d', (random.random() for _ in range(300)))
+        self.output = heap_sort.sort(array('d', self.seq))
+        self.assertEqual(sorted(self.seq), list(self.output))
+
+    def test_sort_range(self):
+        self.seq = [9, 8, 7, 6, 5, 4, 3, 2, 1, 0]
+        heap_sort.sort_range(self.seq, 2, 8)
+        self.assertEqual([9, 8, 2, 3, 4, 5, 6, 7, 1, 0], self.seq)
+
+    def test_build_heap(self):
+        self.seq = list(range(50))
+        heap_sort.build_heap(self.seq, arity=3)
+        for i in range(1, 50):
+            self.assertLessEqual(self.seq[i], self.seq[(i - 1) // 3])
+
+    def test_build_heap_binary(self):
+        self.seq = list(range(50))
+        heap_sort.build_heap(self.seq)
+        for end in range(49, 0, -1):
+            self.seq[0], self.seq[end] = self.seq[end], self.seq[0]
+            heap_sort.max_heapify(self.seq, 0, end - 1)
+        self.assertEqual(list(range(50)), self.seq)
+
+    def test_default_arity(self):
+        self.seq = list(range(50))
+        heap_sort.build_heap(self.seq)
+        for end in range(49, 0, -1):
+            self.seq[0], self.seq[end] = self.seq[end], self.seq[0]
+            heap_sort.sift_down(self.seq, 0, end)
+        self.assertEqual(list(range(50)), self.seq)
+
+
+class TestInPlaceMergeSort(SortingAlgorithmTestCase):
+
+    """
+    Tests In-place merge sort on a small range from 0-9, on larger inputs
+    with repeated keys, and the rotation and merge it is built on
+    """
+
+    def test_in_place_mergesort(self):
+        self.output = in_place_merge_sort.sort(self.input)
+        self.assertIs(self.input, self.output)
+        self.assertEqual(self.correct, self.output)
+
+    def test_in_place_mergesort_large(self):
+        self.seq = [random.randint(0, 50) for _ in range(3000)]
+        self.output = in_place_merge_sort.sort(list(self.seq))
+        self.assertEqual(sorted(self.seq), self.output)
+
+    def test_in_place_mergesort_stable(self):
+        self.seq = [(random.randint(0, 3), i) for i in range(1000)]
+        self.output = in_place_merge_sort.sort(list(self.seq),
+                                               key=lambda r: r[0])
+        self.assertEqual(sorted(self.seq, key=lambda r: r[0]), self.output)
+
+    def test_rotate(self):
+        for lo, mid, hi in ((0, 3, 10), (2, 9, 10), (0, 500, 700),
+                            (100, 400, 700), (0, 350, 700), (5, 5, 9)):
+            self.seq = list(range(700))
+            self.correct = (self.seq[:lo] + self.seq[mid:hi] +
+                            self.seq[lo:mid] + self.seq[hi:])
+            in_place_merge_sort.rotate(self.seq, lo, mid, hi)
+            self.assertEqual(self.correct, self.seq)
+
+    def test_sym_merge(self):
+        self.seq = ([9] + sorted(random.sample(range(1000), 300)) +
+                    sorted(random.sample(range(1000), 500)) + [-1])
+        self.correct = [9] + sorted(self.seq[1:-1]) + [-1]
+        in_place_merge_sort.sym_merge(self.seq, 1, 301, 801)
+        self.assertEqual(self.correct, self.seq)
+
+
+class TestIncrementalQuickSort(SortingAlgorithmTestCase):
+
+    """
+    Tests Incremental quick sort on a small range from 0-9 and reading only
+    a prefix of a larger input
+    """
+
+    def test_incremental_quicksort(self):
+        self.output = list(incremental_quick_sort.sort(self.input))
+        self.assertEqual(self.correct, self.output)
+
+    def test_incremental_quicksort_prefix(self):
+        self.seq = [random.randint(0, 100) for _ in range(1000)]
+        self.iterator = incremental_quick_sort.sort(self.seq)
+        self.output = [next(self.iterator) for _ in range(20)]
+        self.assertEqual(sorted(self.seq)[:20], self.output)
+
+    def test_incremental_quicksort_reverse(self):
+        self.output = list(incremental_quick_sort.sort(self.input,
+                                                       reverse=True))
+        self.assertEqual(self.correct[::-1], self.output)
+
 
 class TestInsertionSort(SortingAlgorithmTestCase):
 
@@ -107,6 +476,35 @@ class TestInsertionSort(SortingAlgorithmTestCase):
         self.assertEqual(self.correct, self.output)
 
 
+class TestKWayMerge(SortingAlgorithmTestCase):
+
+    """
+    Tests the k-way merge of sorted iterators, its stability, key and
+    dedupe options
+    """
+
+    def test_kway_merge(self):
+        self.seq = [sorted(random.sample(range(100), 10)) for _ in range(7)]
+        self.output = list(kway_merge.merge(iter(s) for s in self.seq))
+        self.assertEqual(sorted(sum(self.seq, [])), self.output)
+        self.assertEqual([], list(kway_merge.merge([])))
+        self.assertEqual([], list(kway_merge.merge([[], []])))
+
+    def test_kway_merge_stable(self):
+        self.seq = [[(0, 'a'), (1, 'a')], [(0, 'b')], [(1, 'c'), (2, 'c')]]
+        self.output = list(kway_merge.merge(self.seq, key=lambda x: x[0]))
+        self.assertEqual([(0, 'a'), (0, 'b'), (1, 'a'), (1, 'c'), (2, 'c')],
+                         self.output)
+
+    def test_kway_merge_dedupe(self):
+        self.seq = [[1, 2, 2, 5], [2, 3], [], [5, 9]]
+        self.output = list(kway_merge.merge(self.seq, dedupe=True))
+        self.assertEqual([1, 2, 3, 5, 9], self.output)
+        self.output = list(kway_merge.merge([['a', 'B'], ['b', 'C']],
+                                            key=str.lower, dedupe=True))
+        self.assertEqual(['a', 'B', 'C'], self.output)
+
+
 class TestMergeSort(SortingAlgorithmTestCase):
 
     """
@@ -118,6 +516,27 @@ class TestMergeSort(SortingAlgorithmTestCase):
         self.output = merge_sort.sort(self.input)
         self.assertEqual(self.correct, self.output)
 
+    def test_bottom_up_mergesort(self):
+        self.output = merge_sort.bottom_up_sort(self.input)
+        self.assertEqual(self.correct, self.output)
+
+    def test_bottom_up_mergesort_large(self):
+        self.seq = [random.randint(0, 50) for _ in range(1000)]
+        self.output = merge_sort.bottom_up_sort(list(self.seq))
+        self.assertEqual(sorted(self.seq), self.output)
+
+    def test_merge_into(self):
+        self.src = [1, 3, 5, 0, 2, 4]
+        self.dst = [None] * 6
+        merge_sort.merge_into(self.src, self.dst, 0, 3, 6)
+        self.assertEqual([0, 1, 2, 3, 4, 5], self.dst)
+        for self.src, correct in (([9, 1, 2, 3, 4, 9], [1, 2, 3, 4]),
+                                  ([9, 3, 4, 1, 2, 9], [1, 2, 3, 4]),
+                                  ([9, 1, 4, 2, 3, 9], [1, 2, 3, 4])):
+            self.dst = [None] * 6
+            merge_sort.merge_into(self.src, self.dst, 1, 3, 5)
+            self.assertEqual([None] + correct + [None], self.dst)
+
     def test_merge(self):
         self.seq1 = list(range(0, 5))
         self.seq2 = list(range(5, 10))
@@ -126,6 +545,243 @@ class TestMergeSort(SortingAlgorithmTestCase):
         self.assertIs(self.seq[-1], 9)
 
 
+class TestMultikeyQuickSort(unittest.TestCase):
+
+    """
+    Tests Multikey quick sort on strings with long shared prefixes, and the
+    LCP array it returns
+    """
+
+    def setUp(self):
+        self.words = ['http://example.com/%d/' % random.randint(0, 50) +
+                      'x' * random.randint(0, 40) for _ in range(500)]
+        self.words += ['', 'http', 'http://', 'http://']
+        random.shuffle(self.words)
+
+    def test_multikey_quick_sort(self):
+        self.output = multikey_quick_sort.sort(list(self.words))
+        self.assertEqual(sorted(self.words), self.output)
+
+    def test_multikey_quick_sort_bytes(self):
+        self.seq = [w.encode('ascii') for w in self.words]
+        self.output = multikey_quick_sort.sort(list(self.seq))
+        self.assertEqual(sorted(self.seq), self.output)
+
+    def test_sort_with_lcp(self):
+        self.seq = list(self.words)
+        self.lcp = multikey_quick_sort.sort_with_lcp(self.seq)
+        self.assertEqual(sorted(self.words), self.seq)
+        self.correct = [multikey_quick_sort.common_prefix(a, b)
+                        for a, b in zip(self.seq, self.seq[1:])] + [0]
+        self.assertEqual(self.correct, self.lcp)
+
+    def test_sort_with_lcp_suffixes(self):
+        self.text = 'kmckirrrmppp'
+        self.seq = [self.text[i:] for i in range(len(self.text))]
+        self.lcp = multikey_quick_sort.sort_with_lcp(self.seq)
+        self.assertEqual([0, 0, 1, 0, 1, 0, 1, 2, 0, 1, 2, 0], self.lcp)
+
+    def test_common_prefix(self):
+        self.assertEqual(4, multikey_quick_sort.common_prefix('abcdx',
+                                                              'abcdy'))
+        self.assertEqual(3, multikey_quick_sort.common_prefix('abc',
+                                                              'abcd', 2))
+        self.assertEqual(0, multikey_quick_sort.common_prefix('', 'a'))
+
+
+class TestNaturalMergeSort(SortingAlgorithmTestCase):
+
+    """
+    Tests Natural merge sort on a small range from 0-9 and on inputs made
+    of long runs, which exercise run detection and galloping
+    """
+
+    def test_natural_mergesort(self):
+        self.output = natural_merge_sort.sort(self.input)
+        self.assertEqual(self.correct, self.output)
+
+    def test_natural_mergesort_runs(self):
+        self.seq = (list(range(500)) + list(range(1000, 500, -1)) +
+                    [random.randint(0, 1000) for _ in range(300)])
+        self.output = natural_merge_sort.sort(list(self.seq))
+        self.assertEqual(sorted(self.seq), self.output)
+
+    def test_natural_mergesort_stable(self):
+        self.seq = [1, 0, 1.0, 0.0] * 50
+        self.output = natural_merge_sort.sort(self.seq)
+        self.assertEqual([int, float] * 100, [type(x) for x in self.output])
+
+    def test_count_run(self):
+        self.seq = [5, 4, 3, 3, 7]
+        self.assertEqual(natural_merge_sort.count_run(self.seq, 0, 5), 3)
+        self.assertEqual([3, 4, 5, 3, 7], self.seq)
+
+
+@unittest.skipIf(numpy_backend.np is None, "NumPy is not installed")
+class TestNumpyBackend(SortingAlgorithmTestCase):
+
+    """
+    Tests the vectorized sorts on NumPy arrays and array.array buffers,
+    both directly and through the sorting modules that dispatch to them
+    """
+
+    def setUp(self):
+        super(TestNumpyBackend, self).setUp()
+        np = numpy_backend.np
+        self.arrays = [
+            np.random.randint(-1000, 1000, 1000),
+            np.random.randint(0, 5, 300).astype(np.uint8),
+            np.random.randn(777),
+            np.random.randn(200).astype(np.float32),
+            np.arange(300)[::-1].copy(),
+            np.array([3]),
+            np.array([], dtype=np.int64),
+        ]
+        self.sorts = [numpy_backend.merge_sort, numpy_backend.quick_sort,
+                      numpy_backend.heap_sort, numpy_backend.radix_sort]
+
+    def test_backend_sorts(self):
+        for sort in self.sorts:
+            for seq in self.arrays:
+                correct = sorted(seq.tolist())
+                buf = seq.copy()
+                sort(buf)
+                self.assertEqual(correct, buf.tolist())
+                sort(buf, reverse=True)
+                self.assertEqual(correct[::-1], buf.tolist())
+
+    def test_array_buffer(self):
+        for sort in self.sorts:
+            seq = array('d', [random.uniform(-1, 1) for _ in range(500)])
+            correct = sorted(seq)
+            sort(numpy_backend.as_buffer(seq))
+            self.assertEqual(correct, seq.tolist())
+
+    def test_as_buffer(self):
+        self.assertIsNone(numpy_backend.as_buffer(self.input))
+        self.assertIsNone(numpy_backend.as_buffer(array('u', 'ba')))
+        self.assertIsNone(numpy_backend.as_buffer(
+            numpy_backend.np.zeros((2, 2))))
+
+    def test_dispatch(self):
+        sorts = [
+            bucket_sort.sort,
+            merge_sort.bottom_up_sort,
+            heap_sort.sort,
+            radix_sort.sort,
+            lambda s: quick_sort_in_place.sort(s, 0, len(s) - 1),
+            quick_sort_in_place.introsort,
+        ]
+        for sort in sorts:
+            seq = array('l', self.input)
+            self.assertIs(seq, sort(seq))
+            self.assertEqual(self.correct, seq.tolist())
+            seq = numpy_backend.np.array(self.input)
+            self.assertIs(seq, sort(seq))
+            self.assertEqual(self.correct, seq.tolist())
+
+    def test_merge_sort_copies(self):
+        for seq in (array('l', self.input),
+                    numpy_backend.np.array(self.input)):
+            self.output = merge_sort.sort(seq)
+            self.assertEqual(self.correct, self.output)
+            self.assertIsInstance(self.output, list)
+            self.assertEqual(self.input, seq.tolist())
+
+    def test_nan_and_signed_zeros(self):
+        np = numpy_backend.np
+        seq = np.random.randn(300)
+        seq[::7] = np.nan
+        for seq in (np.array([3.0, np.nan, 1.0, 2.0]), seq):
+            buf = seq.copy()
+            numpy_backend.merge_sort(buf)
+            self.assertTrue(np.array_equal(np.sort(seq), buf,
+                                           equal_nan=True))
+        buf = np.array([0.0, -0.0, 1.0, -0.0])
+        numpy_backend.merge_sort(buf)
+        self.assertEqual([0.0, 0.0, 0.0, 1.0], buf.tolist())
+        self.assertEqual(2, np.signbit(buf).sum())
+
+    def test_quick_sort_nan(self):
+        np = numpy_backend.np
+        for sort in (lambda s: quick_sort_in_place.sort(s, 0, len(s) - 1),
+                     quick_sort_in_place.introsort):
+            seq = np.array([1.0, np.nan, np.nan, 2.0])
+            sort(seq)
+            self.assertEqual([1.0, 2.0], seq[:2].tolist())
+            self.assertTrue(np.isnan(seq[2:]).all())
+
+    def test_partial_range(self):
+        seq = numpy_backend.np.array([9, 8, 7, 6, 5, 4])
+        quick_sort_in_place.introsort(seq, 1, 4)
+        self.assertEqual([9, 5, 6, 7, 8, 4], seq.tolist())
+
+
+class TestParallelMergeSort(SortingAlgorithmTestCase):
+
+    """
+    Tests Parallel merge sort on a small range from 0-9
+    also tests the co_rank split used by the parallel merge
+    """
+
+    def test_parallel_mergesort(self):
+        self.output = parallel_merge_sort.sort(self.input, processes=3)
+        self.assertEqual(self.correct, self.output)
+
+    def test_parallel_mergesort_floats(self):
+        self.seq = [random.uniform(-1, 1) for _ in range(100)]
+        self.output = parallel_merge_sort.sort(self.seq, processes=4)
+        self.assertEqual(sorted(self.seq), self.output)
+
+    def test_parallel_mergesort_exact(self):
+        for self.seq in ([2 ** 60 + 1, 2 ** 60, 0.5, 7],
+                         [2 ** 64, 3, 2, 1], [True, False, 1, 0]):
+            self.output = parallel_merge_sort.sort(self.seq, processes=2)
+            self.assertEqual(sorted(self.seq), self.output)
+            self.assertEqual([type(x) for x in sorted(self.seq)],
+                             [type(x) for x in self.output])
+        self.assertRaises(TypeError, parallel_merge_sort.sort,
+                          [0.1, 0.2, 0.3], 2, 'f')
+
+    def test_co_rank(self):
+        self.seq = [0, 2, 4, 6, 1, 3, 5, 7]
+        self.assertEqual(parallel_merge_sort.co_rank(4, self.seq, 0, 4, 8), 2)
+        self.assertEqual(parallel_merge_sort.co_rank(8, self.seq, 0, 4, 8), 4)
+
+
+class TestPartialSort(SortingAlgorithmTestCase):
+
+    """
+    Tests the streaming top-k functions and the in place partial sort
+    """
+
+    def test_smallest(self):
+        self.output = partial_sort.smallest(iter(self.input), 3)
+        self.assertEqual([0, 1, 2], self.output)
+
+    def test_largest(self):
+        self.output = partial_sort.largest(iter(self.input), 3)
+        self.assertEqual([9, 8, 7], self.output)
+
+    def test_top_k_key_stable(self):
+        self.seq = [(random.randint(0, 3), i) for i in range(100)]
+        self.assertEqual(
+            sorted(self.seq, key=lambda r: r[0])[:10],
+            partial_sort.smallest(self.seq, 10, key=lambda r: r[0]))
+        self.assertEqual(
+            sorted(self.seq, key=lambda r: r[0], reverse=True)[:10],
+            partial_sort.largest(self.seq, 10, key=lambda r: r[0]))
+
+    def test_top_k_short_input(self):
+        self.assertEqual([0, 1], partial_sort.smallest([1, 0], 5))
+        self.assertEqual([], partial_sort.largest(self.input, 0))
+
+    def test_partial_sort(self):
+        self.output = partial_sort.partial_sort(self.input, 4)
+        self.assertEqual([0, 1, 2, 3], self.output[:4])
+        self.assertEqual(self.correct, sorted(self.output))
+
+
 class TestQuickSort(SortingAlgorithmTestCase):
 
     """
@@ -136,6 +792,11 @@ class TestQuickSort(SortingAlgorithmTestCase):
         self.output = quick_sort.sort(self.input)
         self.assertEqual(self.correct, self.output)
 
+    def test_quicksort_duplicates(self):
+        self.seq = [random.randint(0, 2) for _ in range(3000)]
+        self.output = quick_sort.sort(self.seq)
+        self.assertEqual(sorted(self.seq), self.output)
+
 
 class TestQuickSortInPlace(SortingAlgorithmTestCase):
 
@@ -160,6 +821,229 @@ class TestQuickSortInPlace(SortingAlgorithmTestCase):
             5
         )
 
+    def test_quicksort_in_place_duplicates(self):
+        self.seq = [random.randint(0, 2) for _ in range(3000)]
+        self.output = quick_sort_in_place.sort(
+            list(self.seq), 0,
+            len(self.seq)-1
+        )
+        self.assertEqual(sorted(self.seq), self.output)
+
+    def test_three_way_partition(self):
+        self.seq = [2, 1, 2, 0, 2, 1, 0, 2]
+        self.assertEqual(
+            quick_sort_in_place.three_way_partition(self.seq, 0, 7, 1),
+            (2, 3)
+        )
+        self.assertEqual([0, 0, 1, 1], sorted(self.seq[:4]))
+        self.assertEqual([2, 2, 2, 2], self.seq[4:])
+
+    def test_dual_pivot_sort(self):
+        self.output = quick_sort_in_place.dual_pivot_sort(self.input)
+        self.assertEqual(self.correct, self.output)
+
+    def test_dual_pivot_sort_duplicates(self):
+        self.seq = [random.randint(0, 3) for _ in range(500)]
+        self.output = quick_sort_in_place.dual_pivot_sort(list(self.seq))
+        self.assertEqual(sorted(self.seq), self.output)
+
+    def test_introsort(self):
+        self.output = quick_sort_in_place.introsort(self.input)
+        self.assertEqual(self.correct, self.output)
+
+    def test_introsort_adversarial(self):
+        self.seq = [7] * 5000 + list(range(5000, 0, -1))
+        self.output = quick_sort_in_place.introsort(list(self.seq))
+        self.assertEqual(sorted(self.seq), self.output)
+
+    def test_introsort_range(self):
+        self.seq = [9, 8, 7, 6, 5, 4, 3, 2, 1, 0]
+        quick_sort_in_place.introsort(self.seq, 2, 7)
+        self.assertEqual([9, 8, 2, 3, 4, 5, 6, 7, 1, 0], self.seq)
+
+    def test_hoare_partition(self):
+        self.seq = [3] * 20
+        self.assertIn(
+            quick_sort_in_place.hoare_partition(self.seq, 0, 19, 10),
+            range(8, 12)
+        )
+
+
+class TestQuickselect(SortingAlgorithmTestCase):
+
+    """
+    Tests k-selection on a small range from 0-9 and on duplicate heavy data
+    """
+
+    def test_select(self):
+        for k in range(10):
+            self.assertEqual(k, quickselect.select(list(self.input), k))
+
+    def test_select_duplicates(self):
+        self.seq = [random.randint(0, 3) for _ in range(500)]
+        self.output = quickselect.select(list(self.seq), 250)
+        self.assertEqual(sorted(self.seq)[250], self.output)
+
+    def test_select_out_of_range(self):
+        self.assertRaises(IndexError, quickselect.select, self.input, 10)
+
+    def test_median_of_medians(self):
+        self.seq = list(range(100))
+        random.shuffle(self.seq)
+        self.pivot = self.seq[
+            quickselect.median_of_medians(self.seq, 0, 99)]
+        self.assertTrue(30 <= self.pivot <= 70)
+
+    def test_multi_select(self):
+        self.seq = [random.random() for _ in range(1000)]
+        self.ranks = [999, 0, 500, 500, 900]
+        self.output = quickselect.multi_select(self.seq, self.ranks)
+        self.correct = sorted(self.seq)
+        self.assertEqual([self.correct[k] for k in self.ranks], self.output)
+        for k in self.ranks:
+            self.assertEqual(self.correct[k], self.seq[k])
+
+    def test_percentiles(self):
+        self.seq = list(range(1, 101))
+        random.shuffle(self.seq)
+        self.assertEqual([50, 90, 99],
+                         quickselect.percentiles(self.seq, [50, 90, 99]))
+
+
+class Status(int):
+
+    """
+    An int subclass, like the members of an IntEnum.
+    """
+
+
+class TestRadixSort(SortingAlgorithmTestCase):
+
+    """
+    Tests Radix sort on a small range from 0-9, on signed and wide integers,
+    on fixed width keys and on byte strings
+    """
+
+    def test_radixsort(self):
+        self.output = radix_sort.sort(self.input, use_numpy=False)
+        self.assertEqual(self.correct, self.output)
+
+    def test_radixsort_signed(self):
+        self.seq = [random.randint(-2 ** 70, 2 ** 70) for _ in range(200)]
+        self.output = radix_sort.sort(list(self.seq))
+        self.assertEqual(sorted(self.seq), self.output)
+
+    @unittest.skipIf(radix_sort.np is None, "NumPy is not installed")
+    def test_radixsort_numpy(self):
+        self.seq = [random.randint(-2 ** 40, 2 ** 40) for _ in range(200)]
+        self.output = radix_sort.sort(list(self.seq), use_numpy=True)
+        self.assertEqual(sorted(self.seq), self.output)
+
+    def test_radixsort_int_subclasses(self):
+        self.seq = [Status(3), Status(1), True, False, Status(2), 2]
+        for use_numpy in (False, None):
+            self.output = radix_sort.sort(list(self.seq), use_numpy=use_numpy)
+            self.assertEqual([0, 1, 1, 2, 2, 3], self.output)
+            self.assertEqual([bool, Status, bool, Status, int, Status],
+                             [type(x) for x in self.output])
+
+    def test_radixsort_key_reverse(self):
+        self.seq = [(random.randint(-3, 3), i) for i in range(50)]
+        self.output = radix_sort.sort(list(self.seq), key=lambda r: r[0],
+                                      reverse=True)
+        self.assertEqual(sorted(self.seq, key=lambda r: r[0], reverse=True),
+                         self.output)
+
+    def test_sort_fixed(self):
+        self.seq = [bytes(bytearray([random.randint(0, 255)
+                                     for _ in range(4)]))
+                    for _ in range(100)]
+        self.output = radix_sort.sort_fixed(list(self.seq), 4)
+        self.assertEqual(sorted(self.seq), self.output)
+
+    def test_sort_bytes(self):
+        self.seq = [b'b', b'', b'abc', b'ab', b'a', b'ab'] * 10
+        self.output = radix_sort.sort_bytes(list(self.seq))
+        self.assertEqual(sorted(self.seq), self.output)
+
+
+class TestRecordSort(SortingAlgorithmTestCase):
+
+    """
+    Tests sorting fixed-width records in a buffer and in a file through mmap
+    """
+
+    def setUp(self):
+        super(TestRecordSort, self).setUp()
+        self.records = [struct.pack('>I4s', x, os.urandom(4))
+                        for x in self.input * 10]
+
+    def test_record_view(self):
+        for sort in record_sort.SORTS.values():
+            buf = bytearray(b''.join(self.records))
+            records = record_sort.RecordView(buf, 8, key_size=4)
+            self.assertEqual(len(self.records), len(records))
+            sort(records)
+            self.assertEqual(sorted(self.records), [r for _, r in records])
+
+    def test_record_view_errors(self):
+        buf = bytearray(10)
+        self.assertRaises(ValueError, record_sort.RecordView, buf, 4)
+        self.assertRaises(ValueError, record_sort.RecordView, buf, 5, 3, 3)
+        records = record_sort.RecordView(buf, 5)
+        self.assertRaises(IndexError, records.__getitem__, 2)
+        self.assertRaises(TypeError, records.append, (b'', b'12345'))
+
+    def test_sort_file(self):
+        fd, path = tempfile.mkstemp()
+        self.addCleanup(os.remove, path)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(b''.join(self.records))
+        for algorithm in record_sort.SORTS:
+            # The key is the 4 byte value read as a little-endian integer.
+            count = record_sort.sort_file(
+                path, 8, key=lambda r: struct.unpack_from('<I', r)[0],
+                algorithm=algorithm)
+            self.assertEqual(len(self.records), count)
+            with open(path, 'rb') as f:
+                data = f.read()
+            self.output = [data[i:i + 8] for i in range(0, len(data), 8)]
+            self.assertEqual(sorted(self.records), sorted(self.output))
+            keys = [struct.unpack_from('<I', r)[0] for r in self.output]
+            self.assertEqual(sorted(keys), keys)
+
+
+class TestSampleSort(SortingAlgorithmTestCase):
+
+    """
+    Tests Sample sort on a small range from 0-9, on a list large enough to
+    use the worker pool, and the split of skewed data in to buckets
+    """
+
+    def test_samplesort(self):
+        self.output = sample_sort.sort(self.input, processes=2)
+        self.assertEqual(self.correct, self.output)
+
+    def test_samplesort_parallel(self):
+        self.seq = [random.randint(0, 1000) for _ in range(
+            sample_sort.MIN_PARALLEL_SIZE)]
+        self.output = sample_sort.sort(self.seq, processes=3)
+        self.assertEqual(sorted(self.seq), self.output)
+        self.output = sample_sort.sort(self.seq, processes=3,
+                                       key=lambda x: x % 7, reverse=True)
+        self.assertEqual(sorted(self.seq, key=lambda x: x % 7, reverse=True),
+                         self.output)
+
+    def test_partition_skewed(self):
+        self.seq = [0] * 900 + list(range(1, 101))
+        random.shuffle(self.seq)
+        splitters = sample_sort.choose_splitters(self.seq, 4)
+        self.assertIn(0, splitters)
+        buckets = sample_sort.partition(self.seq, splitters)
+        self.assertEqual([0] * 900, buckets[1])
+        self.assertEqual(sorted(self.seq),
+                         [x for b in buckets for x in sorted(b)])
+
 
 class TestSelectionort(SortingAlgorithmTestCase):
 
@@ -182,6 +1066,96 @@ class TestShellSort(SortingAlgorithmTestCase):
         self.output = shell_sort.sort(self.input)
         self.assertEqual(self.correct, self.output)
 
+    def test_shellsort_gap_sequences(self):
+        self.seq = [random.randint(0, 100) for _ in range(500)]
+        for gaps in shell_sort.GAP_SEQUENCES:
+            self.output = shell_sort.sort(list(self.seq), gaps=gaps)
+            self.assertEqual(sorted(self.seq), self.output)
+        self.output = shell_sort.sort(list(self.seq), gaps=[7, 3, 1])
+        self.assertEqual(sorted(self.seq), self.output)
+
+    def test_shellsort_invalid_gaps(self):
+        self.assertRaises(ValueError, shell_sort.sort, self.input,
+                          gaps=[4, 2])
+
+    def test_gap_sequences(self):
+        self.assertEqual([57, 23, 10, 4, 1], shell_sort.ciura(100))
+        self.assertEqual([46, 20, 9, 4, 1], shell_sort.tokuda(100))
+        self.assertEqual([77, 23, 8, 1], shell_sort.sedgewick(100))
+        self.assertEqual([9, 8, 6, 4, 3, 2, 1], shell_sort.pratt(10))
+        self.assertEqual([5, 2, 1], shell_sort.shell(10))
+
+
+class TestSmoothSort(SortingAlgorithmTestCase):
+
+    """
+    Tests Smoothsort on a small range from 0-9, on every permutation of a
+    short list, and on nearly sorted and repetitive input
+    """
+
+    def test_smoothsort(self):
+        self.output = smooth_sort.sort(self.input)
+        self.assertEqual(self.correct, self.output)
+
+    def test_smoothsort_permutations(self):
+        for self.seq in itertools.permutations(range(7)):
+            self.output = smooth_sort.sort(list(self.seq))
+            self.assertEqual(list(range(7)), self.output)
+
+    def test_smoothsort_nearly_sorted(self):
+        self.seq = list(range(1000))
+        for i in range(0, 1000, 8):
+            self.seq[i:i + 8] = reversed(self.seq[i:i + 8])
+        self.seq += [random.randint(0, 3) for _ in range(500)]
+        self.output = smooth_sort.sort(list(self.seq))
+        self.assertEqual(sorted(self.seq), self.output)
+
+
+class TestSortingNetwork(SortingAlgorithmTestCase):
+
+    """
+    Tests the batched sorting network on lists of rows and on NumPy arrays
+    of rows short enough for a network and too long for one
+    """
+
+    def test_network_zero_one(self):
+        # A network sorts every input if it sorts every input of 0s and 1s.
+        for n in range(1, 11):
+            for bits in range(1 << n):
+                seq = [(bits >> i) & 1 for i in range(n)]
+                for lo, hi in sorting_network.network(n):
+                    for a, b in zip(lo, hi):
+                        if seq[a] > seq[b]:
+                            seq[a], seq[b] = seq[b], seq[a]
+                self.assertEqual(sorted(seq), seq)
+
+    def test_sort_rows_lists(self):
+        self.seq = [list(self.input), [2, 1], [], [5, 5, 1]]
+        self.output = sorting_network.sort_rows(self.seq)
+        self.assertEqual([self.correct, [1, 2], [], [1, 5, 5]], self.output)
+
+    @unittest.skipIf(sorting_network.np is None, "NumPy is not installed")
+    def test_sort_rows_numpy(self):
+        np = sorting_network.np
+        for width in [1, 2, 5, 16, 32, sorting_network.MAX_NETWORK_SIZE + 1]:
+            self.seq = np.random.randint(-50, 50, (40, width))
+            correct = [sorted(row) for row in self.seq.tolist()]
+            self.output = sorting_network.sort_rows(self.seq)
+            self.assertIs(self.seq, self.output)
+            self.assertEqual(correct, self.output.tolist())
+        self.assertRaises(ValueError, sorting_network.sort_rows,
+                          np.zeros(3))
+
+    @unittest.skipIf(sorting_network.np is None, "NumPy is not installed")
+    def test_sort_rows_nan_and_signed_zeros(self):
+        np = sorting_network.np
+        self.seq = np.array([[3, np.nan, 1, 2], [0, -0.0, 5, 1]])
+        self.output = sorting_network.sort_rows(self.seq)
+        self.assertEqual([1, 2, 3], self.output[0, :3].tolist())
+        self.assertTrue(np.isnan(self.output[0, 3]))
+        self.assertEqual([0, 0, 1, 5], self.output[1].tolist())
+        self.assertEqual(1, np.signbit(self.output[1]).sum())
+
 
 class TestStrandSort(SortingAlgorithmTestCase):
 
@@ -192,3 +1166,133 @@ class TestStrandSort(SortingAlgorithmTestCase):
     def test_strandsort(self):
         self.output = strand_sort.sort(self.input)
         self.assertEqual(self.correct, self.output)
+
+
+class TestKeyedSort(unittest.TestCase):
+
+    """
+    Tests the key= and reverse= arguments shared by the sorting algorithms
+    """
+
+    def setUp(self):
+        self.records = [(random.randint(0, 3), i) for i in range(30)]
+        self.calls = 0
+        self.algorithms = [
+            bubble_sort.sort, bucket_sort.sort, cocktail_sort.sort,
+            comb_sort.sort, gnome_sort.sort, heap_sort.sort,
+            in_place_merge_sort.sort, insertion_sort.sort, merge_sort.sort,
+            natural_merge_sort.sort, quick_sort.sort,
+            quick_sort_in_place.introsort,
+            quick_sort_in_place.dual_pivot_sort, selection_sort.sort,
+            shell_sort.sort, smooth_sort.sort, strand_sort.sort,
+            lambda seq, **kw: quick_sort_in_place.sort(
+                seq, 0, len(seq) - 1, **kw),
+            lambda seq, **kw: list(external_merge_sort.sort(seq, 7, **kw)),
+        ]
+
+    def key(self, record):
+        self.calls += 1
+        return record[0]
+
+    def test_key(self):
+        for sort in self.algorithms:
+            self.calls = 0
+            self.output = sort(list(self.records), key=self.key)
+            self.assertEqual(
+                sorted(self.records, key=lambda r: r[0]), self.output)
+            self.assertEqual(len(self.records), self.calls)
+
+    def test_key_reverse(self):
+        for sort in self.algorithms:
+            self.output = sort(list(self.records), key=self.key,
+                               reverse=True)
+            self.assertEqual(
+                sorted(self.records, key=lambda r: r[0], reverse=True),
+                self.output)
+
+    def test_reverse(self):
+        self.seq = [r[0] for r in self.records]
+        for sort in self.algorithms:
+            self.output = sort(list(self.seq), reverse=True)
+            self.assertEqual(sorted(self.seq, reverse=True), self.output)
+
+    def test_argsort(self):
+        self.keys = [r[0] for r in self.records]
+        for module in (bubble_sort, bucket_sort, cocktail_sort, comb_sort,
+                       gnome_sort, heap_sort, in_place_merge_sort,
+                       insertion_sort, merge_sort, natural_merge_sort,
+                       quick_sort, quick_sort_in_place, radix_sort,
+                       selection_sort, shell_sort, smooth_sort, strand_sort):
+            for reverse in (False, True):
+                self.output = module.argsort(self.keys, reverse=reverse)
+                self.assertEqual(
+                    sorted(range(len(self.keys)), key=self.keys.__getitem__,
+                           reverse=reverse),
+                    self.output)
+
+    def test_apply_permutation(self):
+        self.names = ['c', 'a', 'd', 'b']
+        self.ages = [30, 10, 40, 20]
+        self.perm = insertion_sort.argsort(self.names)
+        utils.apply_permutation(self.perm, self.names, self.ages)
+        self.assertEqual(['a', 'b', 'c', 'd'], self.names)
+        self.assertEqual([10, 20, 30, 40], self.ages)
+
+    def test_apply_permutation_length(self):
+        self.assertRaises(ValueError, utils.apply_permutation, [0, 1], [1])
+
+    def test_decorate(self):
+        self.seq = ['bb', 'a', 'ccc']
+        self.decorated = utils.decorate(self.seq, key=len)
+        self.assertEqual([(2, 0, 'bb'), (1, 1, 'a'), (3, 2, 'ccc')],
+                         self.decorated)
+        self.assertEqual(self.seq, utils.undecorate(self.decorated))
+
+
+class TestWithoutNumpy(SortingAlgorithmTestCase):
+
+    """
+    Tests the sorts that accept array.array buffers with NumPy hidden, so
+    that they take their pure Python paths and write the result back in to
+    the array
+    """
+
+    modules = (numpy_backend, bucket_sort, radix_sort, sorting_network)
+
+    def setUp(self):
+        super(TestWithoutNumpy, self).setUp()
+        self.saved = [module.np for module in self.modules]
+        for module in self.modules:
+            module.np = None
+
+    def tearDown(self):
+        for module, np in zip(self.modules, self.saved):
+            module.np = np
+
+    def test_array_sorts(self):
+        sorts = [
+            algorithms.sorting.sort,
+            bucket_sort.sort,
+            heap_sort.sort,
+            merge_sort.bottom_up_sort,
+            quick_sort_in_place.introsort,
+            radix_sort.sort,
+        ]
+        for sort in sorts:
+            seq = array('l', self.input)
+            self.assertIs(seq, sort(seq))
+            self.assertEqual(self.correct, seq.tolist())
+            sort(seq, reverse=True)
+            self.assertEqual(self.correct[::-1], seq.tolist())
+            seq = array('l', self.input)
+            sort(seq, key=lambda x: -x)
+            self.assertEqual(self.correct[::-1], seq.tolist())
+
+    def test_auto_sort_radix(self):
+        self.seq = array('l', (random.randint(-2 ** 30, 2 ** 30)
+                               for _ in range(5000)))
+        self.correct = sorted(self.seq)
+        self.assertEqual('radix_sort',
+                         auto_sort.choose(self.seq).algorithm)
+        algorithms.sorting.sort(self.seq)
+        self.assertEqual(self.correct, self.seq.tolist())